@@ -41,6 +41,9 @@ async def get_stock_price(
     force_refresh: bool = Query(
         False, description="Force refresh from API, bypass cache"
     ),
+    stale_while_revalidate: bool = Query(
+        False, description="Return expired cache at once, refresh in background"
+    ),
     db: AsyncSession = db_dep,
 ):
     """
@@ -50,7 +53,10 @@ async def get_stock_price(
     """
     try:
         result = await price_service.get_stock_price(
-            db=db, identifier=identifier, force_refresh=force_refresh
+            db=db,
+            identifier=identifier,
+            force_refresh=force_refresh,
+            stale_while_revalidate=stale_while_revalidate,
         )
         return result
     except ValueError as e:
@@ -322,146 +328,80 @@ async def refresh_all_prices(db: AsyncSession = db_dep):
         results = []
         errors = []
 
-        # Process each asset using the extracted data
-        for asset_data in asset_data_list:
-            try:
-                asset_id = asset_data["id"]
-                asset_symbol = asset_data["symbol"]
-                asset_type = asset_data["type"]
-
-                if asset_type == AssetType.STOCK and asset_symbol:
-                    result = await price_service.get_stock_price(
-                        db=db, identifier=asset_symbol, force_refresh=True
-                    )
-                    results.append(
-                        {
-                            "asset_id": asset_id,
-                            "symbol": asset_symbol,
-                            "type": "stock",
-                            "price": result["price"],
-                            "currency": result["currency"],
-                            "source": result["source"],
-                            "cache_status": result.get(
-                                "cache_status",
-                                {
-                                    "is_valid": True,
-                                    "age_minutes": 0,
-                                    "ttl_minutes": settings.PRICE_CACHE_MINUTES,
-                                },
-                            ),
-                            "cache_valid_until": result.get("cache_valid_until"),
-                        }
-                    )
-                elif asset_type == AssetType.CRYPTO and asset_symbol:
-                    result = await price_service.get_crypto_price(
-                        db=db, symbol=asset_symbol, force_refresh=True
-                    )
-                    results.append(
-                        {
-                            "asset_id": asset_id,
-                            "symbol": asset_symbol,
-                            "type": "crypto",
-                            "price": result["price"],
-                            "currency": result["currency"],
-                            "source": result["source"],
-                            "cache_status": result.get(
-                                "cache_status",
-                                {
-                                    "is_valid": True,
-                                    "age_minutes": 0,
-                                    "ttl_minutes": settings.PRICE_CACHE_MINUTES,
-                                },
-                            ),
-                            "cache_valid_until": result.get("cache_valid_until"),
-                        }
-                    )
-                elif asset_type == AssetType.DERIVATIVE and asset_symbol:
-                    result = await price_service.get_derivative_price(
-                        db=db, isin=asset_symbol, force_refresh=True
-                    )
-                    results.append(
-                        {
-                            "asset_id": asset_id,
-                            "symbol": asset_symbol,
-                            "type": "derivative",
-                            "price": result["price"],
-                            "currency": result["currency"],
-                            "source": result["source"],
-                            "cache_status": result.get(
-                                "cache_status",
-                                {
-                                    "is_valid": True,
-                                    "age_minutes": 0,
-                                    "ttl_minutes": settings.PRICE_CACHE_MINUTES,
-                                },
-                            ),
-                            "cache_valid_until": result.get("cache_valid_until"),
-                        }
-                    )
-            except Exception as e:
-                # Enhanced error handling with cache fallback attempt
-                error_message = str(e)
-                error_detail = {
-                    "asset_id": asset_data.get("id", "unknown"),
-                    "symbol": asset_data.get("symbol", "unknown"),
-                    "error": error_message,
-                    "error_type": (
-                        "api_error" if "API" in error_message else "unknown_error"
-                    ),
-                }
+        # Fetch fresh prices for all priced assets concurrently
+        priced_assets = [
+            asset_data
+            for asset_data in asset_data_list
+            if asset_data["type"] != AssetType.CASH and asset_data["symbol"]
+        ]
+        price_results = await price_service.get_prices(
+            [
+                (asset_data["type"].value, asset_data["symbol"])
+                for asset_data in priced_assets
+            ],
+            force_refresh=True,
+        )
 
-                # Try to fall back to cached data even if expired
-                try:
-                    if asset_type == AssetType.STOCK and asset_symbol:
-                        cached_result = await price_service.get_stock_price(
-                            db=db,
-                            identifier=asset_symbol,
-                            force_refresh=False,
-                            allow_expired=True,
-                        )
-                        if cached_result:
-                            error_detail["cache_fallback_available"] = True
-                            error_detail["cache_data"] = {
-                                "price": cached_result["price"],
-                                "currency": cached_result["currency"],
-                                "cached_at": cached_result["fetched_at"],
-                                "cache_status": cached_result.get("cache_status"),
-                            }
-                    elif asset_type == AssetType.CRYPTO and asset_symbol:
-                        cached_result = await price_service.get_crypto_price(
-                            db=db,
-                            symbol=asset_symbol,
-                            force_refresh=False,
-                            allow_expired=True,
-                        )
-                        if cached_result:
-                            error_detail["cache_fallback_available"] = True
-                            error_detail["cache_data"] = {
-                                "price": cached_result["price"],
-                                "currency": cached_result["currency"],
-                                "cached_at": cached_result["fetched_at"],
-                                "cache_status": cached_result.get("cache_status"),
-                            }
-                    elif asset_type == AssetType.DERIVATIVE and asset_symbol:
-                        cached_result = await price_service.get_derivative_price(
-                            db=db,
-                            isin=asset_symbol,
-                            force_refresh=False,
-                            allow_expired=True,
-                        )
-                        if cached_result:
-                            error_detail["cache_fallback_available"] = True
-                            error_detail["cache_data"] = {
-                                "price": cached_result["price"],
-                                "currency": cached_result["currency"],
-                                "cached_at": cached_result["fetched_at"],
-                                "cache_status": cached_result.get("cache_status"),
-                            }
-                except Exception:
-                    # If fallback fails, continue with original error
-                    pass
-
-                errors.append(error_detail)
+        for asset_data, result in zip(priced_assets, price_results):
+            asset_id = asset_data["id"]
+            asset_symbol = asset_data["symbol"]
+            asset_type = asset_data["type"]
+
+            if not isinstance(result, Exception):
+                results.append(
+                    {
+                        "asset_id": asset_id,
+                        "symbol": asset_symbol,
+                        "type": asset_type.value,
+                        "price": result["price"],
+                        "currency": result["currency"],
+                        "source": result["source"],
+                        "cache_status": result.get(
+                            "cache_status",
+                            {
+                                "is_valid": True,
+                                "age_minutes": 0,
+                                "ttl_minutes": settings.PRICE_CACHE_MINUTES,
+                            },
+                        ),
+                        "cache_valid_until": result.get("cache_valid_until"),
+                    }
+                )
+                continue
+
+            # Enhanced error handling with cache fallback attempt
+            error_message = str(result)
+            error_detail = {
+                "asset_id": asset_id,
+                "symbol": asset_symbol,
+                "error": error_message,
+                "error_type": (
+                    "api_error" if "API" in error_message else "unknown_error"
+                ),
+            }
+
+            # Try to fall back to cached data even if expired
+            try:
+                cached_result = await price_service.get_price(
+                    db=db,
+                    asset_type=asset_type.value,
+                    identifier=asset_symbol,
+                    force_refresh=False,
+                    allow_expired=True,
+                )
+                if cached_result:
+                    error_detail["cache_fallback_available"] = True
+                    error_detail["cache_data"] = {
+                        "price": cached_result["price"],
+                        "currency": cached_result["currency"],
+                        "cached_at": cached_result["fetched_at"],
+                        "cache_status": cached_result.get("cache_status"),
+                    }
+            except Exception:
+                # If fallback fails, continue with original error
+                pass
+
+            errors.append(error_detail)
 
         return {
             "refreshed": len(results),
@@ -505,36 +445,26 @@ async def get_cache_stats(db: AsyncSession = db_dep):
     Get statistics about the price cache.
     """
     from sqlalchemy.future import select
-    from sqlalchemy import func
+    from sqlalchemy import case, func
     from app.models.price_cache import PriceCache
     from datetime import datetime, timedelta
 
-    # Total cache entries
-    total_result = await db.execute(select(func.count(PriceCache.id)))
-    total_count = total_result.scalar()
-
-    # Fresh cache entries (within configured minutes)
+    # Count all entries, fresh entries (within configured minutes) and entries
+    # by asset type in a single pass over the table
     cutoff_time = datetime.utcnow() - timedelta(minutes=settings.PRICE_CACHE_MINUTES)
-    fresh_result = await db.execute(
-        select(func.count(PriceCache.id)).where(PriceCache.fetched_at >= cutoff_time)
-    )
-    fresh_count = fresh_result.scalar()
-
-    # Cache entries by asset type
-    stock_result = await db.execute(
-        select(func.count(PriceCache.id)).where(PriceCache.asset_type == "stock")
-    )
-    stock_count = stock_result.scalar()
-
-    crypto_result = await db.execute(
-        select(func.count(PriceCache.id)).where(PriceCache.asset_type == "crypto")
+    result = await db.execute(
+        select(
+            func.count(PriceCache.id),
+            func.sum(case((PriceCache.fetched_at >= cutoff_time, 1), else_=0)),
+            func.sum(case((PriceCache.asset_type == "stock", 1), else_=0)),
+            func.sum(case((PriceCache.asset_type == "crypto", 1), else_=0)),
+            func.sum(case((PriceCache.asset_type == "derivative", 1), else_=0)),
+        )
     )
-    crypto_count = crypto_result.scalar()
-
-    derivative_result = await db.execute(
-        select(func.count(PriceCache.id)).where(PriceCache.asset_type == "derivative")
+    # SUM over an empty table is NULL
+    total_count, fresh_count, stock_count, crypto_count, derivative_count = (
+        count or 0 for count in result.one()
     )
-    derivative_count = derivative_result.scalar()
 
     return {
         "total_entries": total_count,
@@ -552,21 +482,18 @@ async def get_conversion_cache_stats(db: AsyncSession = db_dep):
     Get statistics about the conversion cache.
     """
     from sqlalchemy.future import select
-    from sqlalchemy import func
+    from sqlalchemy import case, func
     from app.models.conversion_cache import ConversionCache
 
-    # Total conversion cache entries
-    total_result = await db.execute(select(func.count(ConversionCache.id)))
-    total_count = total_result.scalar()
-
-    # Fresh conversion cache entries (within configured hours)
+    # Total and fresh (within configured hours) entries in a single query
     cutoff_time = datetime.utcnow() - timedelta(hours=settings.CONVERSION_CACHE_HOURS)
-    fresh_result = await db.execute(
-        select(func.count(ConversionCache.id)).where(
-            ConversionCache.fetched_at >= cutoff_time
+    result = await db.execute(
+        select(
+            func.count(ConversionCache.id),
+            func.sum(case((ConversionCache.fetched_at >= cutoff_time, 1), else_=0)),
         )
     )
-    fresh_count = fresh_result.scalar()
+    total_count, fresh_count = (count or 0 for count in result.one())
 
     return {
         "total_entries": total_count,
@@ -588,20 +515,30 @@ async def get_asset_cache_status(db: AsyncSession = db_dep):
     assets = await crud_asset.get_assets(db=db, skip=0, limit=1000)
     cache_status = []
 
+    # Load the latest cache entry of every priced asset in one query
+    priced_types = (AssetType.STOCK, AssetType.CRYPTO, AssetType.DERIVATIVE)
+    cache_entries = await crud_price_cache.get_cached_prices_bulk(
+        db,
+        (
+            (asset.symbol, asset.type.value)
+            for asset in assets
+            if asset.type in priced_types and asset.symbol
+        ),
+    )
+
+    # Validate all entries against a single cutoff
+    valid_entries, _ = cache_management_service.partition_valid(cache_entries.values())
+    valid_ids = {entry.id for entry in valid_entries}
+
     for asset in assets:
         # Extract asset data while in async context
         asset_id = asset.id
         asset_symbol = asset.symbol
         asset_type = asset.type
 
-        if (
-            asset_type in [AssetType.STOCK, AssetType.CRYPTO, AssetType.DERIVATIVE]
-            and asset_symbol
-        ):
+        if asset_type in priced_types and asset_symbol:
             # Check if we have cached data for this asset
-            cache_entry = await crud_price_cache.get_cache_by_symbol(
-                db=db, symbol=asset_symbol, asset_type=asset_type.value
-            )
+            cache_entry = cache_entries.get((asset_symbol, asset_type.value))
 
             cached_at = None
             expires_at = None
@@ -610,7 +547,7 @@ async def get_asset_cache_status(db: AsyncSession = db_dep):
 
             if cache_entry:
                 cached_at = cache_entry.fetched_at
-                is_valid = cache_management_service.is_price_cache_valid(cache_entry)
+                is_valid = cache_entry.id in valid_ids
                 expires_at = cache_management_service.get_price_cache_expiration(
                     cache_entry
                 )
@@ -1,11 +1,25 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, delete, func
 from app.models.conversion_cache import ConversionCache
 from app.schemas.conversion_cache import ConversionCacheCreate
 from datetime import datetime, timedelta
 from typing import Optional
 
+# Statements reused by every scheduled cleanup, parameterised by :cutoff and :limit
+_HAS_OLD_ENTRIES_STMT = (
+    select(ConversionCache.id)
+    .where(ConversionCache.fetched_at < bindparam("cutoff"))
+    .limit(1)
+)
+_DELETE_OLD_ENTRIES_BATCH_STMT = delete(ConversionCache).where(
+    ConversionCache.id.in_(
+        select(ConversionCache.id)
+        .where(ConversionCache.fetched_at < bindparam("cutoff"))
+        .limit(bindparam("limit"))
+    )
+)
+
 # --- Conversion Cache CRUD Operations ---
 
 
@@ -165,14 +179,48 @@ async def get_cached_conversion_rates_batch(
         return cache_dict
 
 
-async def cleanup_old_conversion_cache_entries(db: AsyncSession, max_age_days: int = 7):
+async def has_old_conversion_cache_entries(
+    db: AsyncSession, max_age_days: int = 7
+) -> bool:
+    """
+    Check whether any conversion cache entries are older than specified days.
+
+    Args:
+        db: AsyncSession - database session
+        max_age_days: int - maximum age of cache entries in days (default: 7)
+
+    Returns:
+        bool: True if at least one entry is older than max_age_days
+    """
+    cutoff_time = datetime.utcnow() - timedelta(days=max_age_days)
+    result = await db.execute(_HAS_OLD_ENTRIES_STMT, {"cutoff": cutoff_time})
+    return result.first() is not None
+
+
+async def cleanup_old_conversion_cache_entries(
+    db: AsyncSession, max_age_days: int = 7, limit: Optional[int] = None
+) -> int:
     """
     Remove conversion cache entries older than specified days.
 
     Args:
         db: AsyncSession - database session
         max_age_days: int - maximum age of cache entries in days (default: 7)
+        limit: Optional[int] - delete at most this many entries, so callers can
+            clean up in short batches (default: no limit)
+
+    Returns:
+        int: number of deleted entries
     """
+    if limit is not None:
+        # Bounded delete keeps each transaction short on large tables
+        cutoff_time = datetime.utcnow() - timedelta(days=max_age_days)
+        result = await db.execute(
+            _DELETE_OLD_ENTRIES_BATCH_STMT, {"cutoff": cutoff_time, "limit": limit}
+        )
+        await db.commit()
+        return result.rowcount or 0
+
     # Try to use optimized implementation if available
     try:
         from app.services.optimized_cache_queries import cleanup_cache_optimized
@@ -183,9 +231,6 @@ async def cleanup_old_conversion_cache_entries(db: AsyncSession, max_age_days: i
         # Fall back to original implementation
         cutoff_time = datetime.utcnow() - timedelta(days=max_age_days)
 
-        # Use a more efficient batch delete operation
-        from sqlalchemy import delete, func
-
         # Count entries to be deleted first
         count_query = (
             select(func.count())
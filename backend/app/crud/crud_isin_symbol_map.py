@@ -0,0 +1,43 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.models.isin_symbol_map import IsinSymbolMap
+from datetime import datetime
+from typing import Optional
+
+# --- ISIN Symbol Map CRUD Operations ---
+
+
+async def get_symbol_for_isin(db: AsyncSession, isin: str) -> Optional[str]:
+    """
+    Get the previously resolved ticker symbol for an ISIN.
+
+    Args:
+        db: AsyncSession - database session
+        isin: str - ISIN identifier
+
+    Returns:
+        str: resolved symbol if the ISIN was resolved before, None otherwise
+    """
+    result = await db.execute(
+        select(IsinSymbolMap.symbol).where(IsinSymbolMap.isin == isin.upper())
+    )
+    return result.scalar_one_or_none()
+
+
+async def save_isin_symbol(db: AsyncSession, isin: str, symbol: str) -> IsinSymbolMap:
+    """
+    Store (or replace) the resolved ticker symbol for an ISIN.
+
+    Args:
+        db: AsyncSession - database session
+        isin: str - ISIN identifier
+        symbol: str - ticker symbol the ISIN resolved to
+
+    Returns:
+        IsinSymbolMap: the stored mapping
+    """
+    mapping = await db.merge(
+        IsinSymbolMap(isin=isin.upper(), symbol=symbol, resolved_at=datetime.utcnow())
+    )
+    await db.commit()
+    return mapping
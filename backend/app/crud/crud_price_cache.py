@@ -1,10 +1,23 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, bindparam, delete, func, or_
 from app.models.price_cache import PriceCache
 from app.schemas.price_cache import PriceCacheCreate, PriceCacheUpdate
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
+import time
+
+# Statements reused by every scheduled cleanup, parameterised by :cutoff and :limit
+_HAS_OLD_ENTRIES_STMT = (
+    select(PriceCache.id).where(PriceCache.fetched_at < bindparam("cutoff")).limit(1)
+)
+_DELETE_OLD_ENTRIES_BATCH_STMT = delete(PriceCache).where(
+    PriceCache.id.in_(
+        select(PriceCache.id)
+        .where(PriceCache.fetched_at < bindparam("cutoff"))
+        .limit(bindparam("limit"))
+    )
+)
 
 # --- Price Cache CRUD Operations ---
 
@@ -60,7 +73,9 @@ async def get_cached_price(
                     PriceCache.fetched_at >= cutoff_time,
                 )
             )
-            .order_by(PriceCache.fetched_at.desc())
+            .order_by(
+                PriceCache.version.desc().nulls_last(), PriceCache.fetched_at.desc()
+            )
             .limit(1)
         )
         return result.scalar_one_or_none()
@@ -72,6 +87,9 @@ async def get_cache_by_symbol(
     """
     Get the most recent cached price for a symbol regardless of age.
 
+    Entries are ordered by version (upstream fetch time) first, so a slower
+    concurrent refresh stored later cannot shadow a newer price.
+
     Args:
         db: AsyncSession - database session
         symbol: str - asset symbol/identifier
@@ -88,12 +106,72 @@ async def get_cache_by_symbol(
                 PriceCache.asset_type == asset_type,
             )
         )
-        .order_by(PriceCache.fetched_at.desc())
+        .order_by(PriceCache.version.desc().nulls_last(), PriceCache.fetched_at.desc())
         .limit(1)
     )
     return result.scalar_one_or_none()
 
 
+async def get_cached_prices_bulk(
+    db: AsyncSession, keys: Iterable[Tuple[str, str]]
+) -> Dict[Tuple[str, str], PriceCache]:
+    """
+    Get the most recent cached price for many symbols in a single query.
+
+    Uses the same ordering as get_cache_by_symbol, but ranks the entries in
+    the database so only the latest row per symbol is loaded.
+
+    Args:
+        db: AsyncSession - database session
+        keys: (symbol, asset_type) pairs to look up
+
+    Returns:
+        Dict mapping (symbol, asset_type) to the most recent cache entry;
+        pairs without any cached price are left out
+    """
+    keys = set(keys)
+    if not keys:
+        return {}
+
+    symbols = {symbol for symbol, _ in keys}
+    asset_types = {asset_type for _, asset_type in keys}
+
+    ranked = (
+        select(
+            PriceCache.id,
+            func.row_number()
+            .over(
+                partition_by=(PriceCache.symbol, PriceCache.asset_type),
+                order_by=(
+                    PriceCache.version.desc().nulls_last(),
+                    PriceCache.fetched_at.desc(),
+                ),
+            )
+            .label("rank"),
+        )
+        .where(
+            and_(
+                PriceCache.symbol.in_(symbols),
+                PriceCache.asset_type.in_(asset_types),
+            )
+        )
+        .subquery()
+    )
+    result = await db.execute(
+        select(PriceCache)
+        .join(ranked, PriceCache.id == ranked.c.id)
+        .where(ranked.c.rank == 1)
+    )
+
+    # The IN filters may match symbol/type combinations that weren't asked for
+    latest = {}
+    for entry in result.scalars():
+        key = (entry.symbol, entry.asset_type)
+        if key in keys:
+            latest[key] = entry
+    return latest
+
+
 async def update_or_create_price_cache(
     db: AsyncSession,
     symbol: str,
@@ -101,10 +179,15 @@ async def update_or_create_price_cache(
     price: float,
     currency: str,
     source: str,
+    version: Optional[int] = None,
 ) -> PriceCache:
     """
     Update existing price cache entry or create a new one.
     Always creates a new entry with current timestamp.
+
+    Args:
+        version: Optional nanosecond timestamp of the upstream fetch,
+            defaults to the current time
     """
     cache_data = PriceCacheCreate(
         symbol=symbol,
@@ -112,6 +195,7 @@ async def update_or_create_price_cache(
         price=price,
         currency=currency,
         source=source,
+        version=version if version is not None else time.time_ns(),
     )
     return await create_price_cache(db=db, cache_in=cache_data)
 
@@ -153,7 +237,11 @@ async def get_cached_prices_batch(
                     PriceCache.fetched_at >= cutoff_time,
                 )
             )
-            .order_by(PriceCache.symbol, PriceCache.fetched_at.desc())
+            .order_by(
+                PriceCache.symbol,
+                PriceCache.version.desc().nulls_last(),
+                PriceCache.fetched_at.desc(),
+            )
         )
 
         all_entries = result.scalars().all()
@@ -167,14 +255,46 @@ async def get_cached_prices_batch(
         return cache_dict
 
 
-async def cleanup_old_cache_entries(db: AsyncSession, max_age_days: int = 30):
+async def has_old_cache_entries(db: AsyncSession, max_age_days: int = 30) -> bool:
+    """
+    Check whether any cache entries are older than specified days.
+
+    Args:
+        db: AsyncSession - database session
+        max_age_days: int - maximum age of cache entries in days (default: 30)
+
+    Returns:
+        bool: True if at least one entry is older than max_age_days
+    """
+    cutoff_time = datetime.utcnow() - timedelta(days=max_age_days)
+    result = await db.execute(_HAS_OLD_ENTRIES_STMT, {"cutoff": cutoff_time})
+    return result.first() is not None
+
+
+async def cleanup_old_cache_entries(
+    db: AsyncSession, max_age_days: int = 30, limit: Optional[int] = None
+) -> int:
     """
     Remove cache entries older than specified days.
 
     Args:
         db: AsyncSession - database session
         max_age_days: int - maximum age of cache entries in days (default: 30)
+        limit: Optional[int] - delete at most this many entries, so callers can
+            clean up in short batches (default: no limit)
+
+    Returns:
+        int: number of deleted entries
     """
+    if limit is not None:
+        # Bounded delete keeps each transaction short on large tables
+        cutoff_time = datetime.utcnow() - timedelta(days=max_age_days)
+        result = await db.execute(
+            _DELETE_OLD_ENTRIES_BATCH_STMT, {"cutoff": cutoff_time, "limit": limit}
+        )
+        await db.commit()
+        return result.rowcount or 0
+
     # Try to use optimized implementation if available
     try:
         from app.services.optimized_cache_queries import cleanup_cache_optimized
@@ -185,9 +305,6 @@ async def cleanup_old_cache_entries(db: AsyncSession, max_age_days: int = 30):
         # Fall back to original implementation
         cutoff_time = datetime.utcnow() - timedelta(days=max_age_days)
 
-        # Use a more efficient batch delete operation
-        from sqlalchemy import delete
-
         # Count entries to be deleted first
         count_query = (
             select(func.count())
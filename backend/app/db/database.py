@@ -27,6 +27,19 @@ def set_session_maker(session_maker: async_sessionmaker) -> None:
     _current_session_maker = session_maker
 
 
+def get_session_maker() -> async_sessionmaker:
+    """
+    Get the session maker currently used by the application.
+
+    Code that opens its own sessions outside of a request should use this
+    instead of SessionLocal so it honours set_session_maker.
+
+    Returns:
+        async_sessionmaker: The configured session maker
+    """
+    return _current_session_maker
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Get a database session as a dependency.
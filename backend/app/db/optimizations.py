@@ -10,6 +10,7 @@ from sqlalchemy import Index, text
 from app.core.config import settings
 from app.models.price_cache import PriceCache
 from app.models.conversion_cache import ConversionCache
+from app.models.session import Session
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -64,6 +65,20 @@ async def create_database_indexes():
                     )
                 )
 
+                # Index for session cleanup and expired session counts
+                await session.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)"
+                    )
+                )
+
+                # Partial index covering only active sessions (active session counts)
+                await session.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS idx_sessions_active_expires_at ON sessions (expires_at) WHERE is_active = 1"
+                    )
+                )
+
             else:
                 # For other databases, we can use SQLAlchemy's Index objects
                 # These will be created when the tables are created
@@ -84,6 +99,7 @@ async def create_database_indexes():
                     Index(
                         "idx_conversion_cache_fetched_at", ConversionCache.fetched_at
                     ),
+                    Index("idx_sessions_expires_at", Session.expires_at),
                 ]
 
                 # Create each index if it doesn't exist
@@ -97,6 +113,18 @@ async def create_database_indexes():
                     except Exception as e:
                         logger.warning(f"Could not create index {index.name}: {e}")
 
+                # Partial index covering only active sessions (active session counts)
+                try:
+                    await session.execute(
+                        text(
+                            "CREATE INDEX IF NOT EXISTS idx_sessions_active_expires_at ON sessions (expires_at) WHERE is_active = true"
+                        )
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Could not create index idx_sessions_active_expires_at: {e}"
+                    )
+
             await session.commit()
             logger.debug("Database indexes created successfully")
 
@@ -106,16 +134,53 @@ async def create_database_indexes():
             raise
 
 
+async def add_missing_columns():
+    """
+    Add columns that were introduced after a table was first created.
+
+    Tables are created with metadata.create_all, which never alters existing
+    tables, so databases from older releases need these added explicitly.
+    """
+    from sqlalchemy import inspect
+    from app.db.session import engine
+
+    # table name -> {column name: column DDL}
+    missing_columns = {
+        "price_cache": {"version": "BIGINT"},
+    }
+
+    async with engine.begin() as conn:
+        for table_name, columns in missing_columns.items():
+            existing = await conn.run_sync(
+                lambda sync_conn: {
+                    column["name"]
+                    for column in inspect(sync_conn).get_columns(table_name)
+                }
+            )
+            for column_name, column_ddl in columns.items():
+                if column_name not in existing:
+                    logger.info(f"Adding column {table_name}.{column_name}")
+                    await conn.execute(
+                        text(
+                            f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_ddl}"
+                        )
+                    )
+
+
 async def optimize_database():
     """
     Perform database optimization tasks.
 
     This function runs various optimization tasks including:
+    - Adding columns missing from tables created by older releases
     - Creating indexes for better query performance
     - Running ANALYZE on SQLite databases for query plan optimization
     """
     logger.debug("Starting database optimization")
 
+    # Bring tables created by older releases up to date
+    await add_missing_columns()
+
     # Create indexes for better query performance
     await create_database_indexes()
 
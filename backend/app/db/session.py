@@ -16,12 +16,18 @@ DATABASE_URL = get_database_url()
 
 # --- Engine & Session Setup ---
 
+# Pooled engines hand out the most recently returned connection first, so a
+# few warm connections serve most requests and surplus ones idle out sooner.
+# In-memory SQLite uses a single static connection and takes no pool options.
+pool_options = {} if ":memory:" in DATABASE_URL else {"pool_use_lifo": True}
+
 # Create the SQLAlchemy async engine
 engine = create_async_engine(
     DATABASE_URL,
     connect_args=(
         {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
     ),
+    **pool_options,
 )
 
 # Create a configured async sessionmaker
@@ -4,15 +4,221 @@ This module provides a simplified implementation for serving static files
 generated by SvelteKit's adapter-static.
 """
 
+import mimetypes
 import os
 import pathlib
+import re
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
+from typing import Collection, Optional, Tuple
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, JSONResponse, HTMLResponse
+from fastapi.responses import FileResponse, JSONResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Serve web app manifests with their proper MIME type
+mimetypes.add_type("application/manifest+json", ".webmanifest")
+
+# Files whose names are not content-hashed must be revalidated on every use
+REVALIDATE_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+# SvelteKit content-hashes everything under _app/immutable, so it never changes
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Paths under /api are never served by the frontend
+API_PATH_PATTERN = re.compile(r"api(?:/|$)")
+
+# Files up to this size are kept in memory after their first read
+MAX_CACHED_FILE_BYTES = 64 * 1024
+
+# Precompressed siblings emitted by the SvelteKit build, in order of preference
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_encodings(accept_encoding: str) -> Collection[str]:
+    """
+    Parse the content codings a client accepts.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding header
+
+    Returns:
+        Names of the accepted codings, excluding any refused with q=0
+    """
+    accepted = set()
+    for token in accept_encoding.split(","):
+        coding, _, params = token.partition(";")
+        quality = params.replace(" ", "").lower()
+        if quality.startswith("q=") and quality[2:].strip("0.") == "":
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def select_precompressed(
+    path: str, accept_encoding: str, available: Collection[str]
+) -> Tuple[str, Optional[str]]:
+    """
+    Pick the precompressed variant of a file that the client accepts.
+
+    Args:
+        path: Path of the uncompressed file
+        accept_encoding: Value of the request's Accept-Encoding header
+        available: Paths of the precompressed files that exist
+
+    Returns:
+        Tuple of the path to serve and its content coding, or None for the
+        uncompressed file
+    """
+    if accept_encoding:
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if path + suffix in available and encoding in accepted:
+                return path + suffix, encoding
+    return path, None
+
+
+def has_precompressed(path: str, available: Collection[str]) -> bool:
+    """Check whether any precompressed variant of a file exists."""
+    return any(path + suffix in available for _, suffix in PRECOMPRESSED_ENCODINGS)
+
+
+class AppStaticFiles(StaticFiles):
+    """
+    StaticFiles for SvelteKit's _app directory that lets browsers cache the
+    content-hashed files under immutable/ indefinitely and serves the build's
+    precompressed .br/.gz variants to clients that accept them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The build output is fixed, so index the compressed variants once
+        self.precompressed = frozenset(
+            os.path.relpath(os.path.join(root, name), self.directory)
+            for root, _, names in os.walk(self.directory)
+            for name in names
+            if name.endswith(tuple(suffix for _, suffix in PRECOMPRESSED_ENCODINGS))
+        )
+
+    async def get_response(self, path, scope):
+        if not has_precompressed(path, self.precompressed):
+            return await super().get_response(path, scope)
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        served_path, encoding = select_precompressed(
+            path, accept_encoding, self.precompressed
+        )
+        response = await super().get_response(served_path, scope)
+        response.headers["Vary"] = "Accept-Encoding"
+        if encoding is not None and response.status_code == 200:
+            response.headers["Content-Encoding"] = encoding
+        return response
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        immutable_dir = os.path.join(str(self.directory), "immutable", "")
+        if str(full_path).startswith(immutable_dir):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+
+@lru_cache(maxsize=64)
+def _read_small_file(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a small file, caching its contents per file version.
+
+    Args:
+        path: File to read
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
+
+    Returns:
+        The file contents
+    """
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def _is_not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """
+    Check the request's conditional headers against the current file version.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the file
+        mtime: Current modification time of the file
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since
+        if if_none_match.strip() == "*":
+            return True
+        return etag in (
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+def conditional_file_response(
+    path: str,
+    request: Request,
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+    content_encoding: Optional[str] = None,
+    vary_encoding: bool = False,
+) -> Response:
+    """
+    Serve a file with ETag and Last-Modified headers, answering conditional
+    requests for an unchanged file with 304 Not Modified.
+
+    Args:
+        path: File to serve
+        request: Incoming request
+        cache_control: Cache-Control header value
+        content_encoding: Content coding of a precompressed file
+        vary_encoding: Whether the response depends on Accept-Encoding
+
+    Returns:
+        FileResponse, or an empty 304 response if the client's copy is current
+    """
+    stat_result = os.stat(path)
+    # Derived from mtime and size, so no hashing is needed
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+    if vary_encoding:
+        headers["Vary"] = "Accept-Encoding"
+
+    if _is_not_modified(request, etag, stat_result.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    if content_encoding is not None:
+        headers["Content-Encoding"] = content_encoding
+
+    # Small files such as index.html and icons are served from memory
+    if stat_result.st_size <= MAX_CACHED_FILE_BYTES:
+        content = _read_small_file(path, stat_result.st_mtime_ns, stat_result.st_size)
+        media_type = mimetypes.guess_type(path)[0] or "text/plain"
+        return Response(content=content, media_type=media_type, headers=headers)
+
+    return FileResponse(path, headers=headers, stat_result=stat_result)
+
 
 def setup_frontend(app: FastAPI):
     """
@@ -62,62 +268,54 @@ def setup_frontend(app: FastAPI):
     # This handles all files in _app directory (immutable assets)
     if (static_dir / "_app").exists():
         app.mount(
-            "/_app", StaticFiles(directory=str(static_dir / "_app")), name="static_app"
+            "/_app",
+            AppStaticFiles(directory=str(static_dir / "_app")),
+            name="static_app",
         )
         logger.info("Mounted /_app static files")
 
-    # Mount other static files (favicon, robots.txt, etc.)
-    static_files = [
-        "favicon.png",
-        "favicon.svg",
-        "favicon.ico",
-        "favicon-96x96.png",
-        "apple-touch-icon.png",
-        "robots.txt",
-        "manifest.json",
-        "site.webmanifest",
-        "web-app-manifest-192x192.png",
-        "web-app-manifest-512x512.png",
-        "logo.png",
-    ]
-    for static_file in static_files:
-        file_path = static_dir / static_file
-        if file_path.exists():
-            # Create a closure to capture the current static_file value
-            def create_static_handler(file_name: str, file_path: pathlib.Path):
-                @app.get(f"/{file_name}")
-                async def serve_static_file():
-                    # Set proper MIME type for web manifest
-                    if file_name == "site.webmanifest":
-                        return FileResponse(
-                            str(file_path),
-                            media_type="application/manifest+json",
-                        )
-                    return FileResponse(str(file_path))
-
-                return serve_static_file
-
-            create_static_handler(static_file, file_path)
-            logger.info(f"Registered static file route: /{static_file}")
-
-    # SPA route handler - serve index.html for all non-API and non-static routes
+    # Index the build output once; it does not change while the app is running.
+    # Paths are kept as plain strings so requests never build Path objects.
+    known_files = {
+        path.relative_to(static_dir).as_posix(): str(path)
+        for path in static_dir.rglob("*")
+        if path.is_file()
+    }
+    index_path = os.path.join(str(static_dir), "index.html")
+    logger.info(f"Indexed {len(known_files)} frontend files")
+
+    def file_response(relative_path: str, request: Request) -> Response:
+        # Prefer a precompressed sibling from the build when the client takes it
+        if not has_precompressed(relative_path, known_files):
+            return conditional_file_response(known_files[relative_path], request)
+
+        served_path, encoding = select_precompressed(
+            relative_path, request.headers.get("accept-encoding", ""), known_files
+        )
+        return conditional_file_response(
+            known_files[served_path],
+            request,
+            content_encoding=encoding,
+            vary_encoding=True,
+        )
+
+    # SPA route handler - serves top-level static files (favicon, robots.txt, etc.)
+    # and falls back to index.html for all other non-API routes
     @app.get("/{full_path:path}")
     async def serve_spa(request: Request, full_path: str):
         # Skip API routes - these should be handled by FastAPI's router
-        if full_path.startswith("api"):
+        if API_PATH_PATTERN.match(full_path):
             # This should not be reached if API routes are properly registered
             logger.warning(f"API route not handled by router: {full_path}")
             return JSONResponse(status_code=404, content={"detail": "Not Found"})
 
         # Check if the path exists as a static file first
-        requested_path = static_dir / full_path
-        if requested_path.exists() and requested_path.is_file():
-            return FileResponse(str(requested_path))
+        if full_path in known_files:
+            return file_response(full_path, request)
 
         # For SPA routing, return the index.html file
-        index_path = static_dir / "index.html"
-        if index_path.exists():
-            return FileResponse(str(index_path))
+        if "index.html" in known_files:
+            return file_response("index.html", request)
 
         # If index.html doesn't exist, return 404
         logger.error(f"index.html not found at {index_path}")
@@ -24,6 +24,7 @@ from app.services.demo_service import demo_service
 # Import models to ensure they are registered with SQLAlchemy
 from app.models import asset
 from app.models import price_cache
+from app.models import isin_symbol_map
 from app.models import session
 
 # Configure logging
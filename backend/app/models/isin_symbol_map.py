@@ -0,0 +1,25 @@
+from sqlalchemy import Column, String, DateTime
+from app.db.session import Base
+from datetime import datetime
+
+
+class IsinSymbolMap(Base):
+    """
+    SQLAlchemy model for resolved ISIN to ticker symbol mappings.
+    ISIN lookups are effectively permanent, so a resolved symbol is stored
+    once and reused instead of calling the symbol lookup API again.
+    """
+
+    __tablename__ = "isin_symbol_map"
+
+    # --- Primary Key ---
+    isin = Column(String, primary_key=True, index=True)
+
+    # --- Resolved Symbol ---
+    symbol = Column(String, nullable=False)
+
+    # --- Metadata ---
+    resolved_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<IsinSymbolMap(isin={self.isin}, symbol={self.symbol}, resolved_at={self.resolved_at})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import BigInteger, Column, Integer, String, Float, DateTime
 from app.db.session import Base
 from datetime import datetime
 
@@ -25,6 +25,9 @@ class PriceCache(Base):
     # --- Cache Metadata ---
     fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     source = Column(String, nullable=False)  # 'finnhub', 'yfinance', 'coingecko', etc.
+    # Nanosecond timestamp of when the price was fetched upstream; orders entries
+    # by fetch time even when concurrent refreshes are stored out of order
+    version = Column(BigInteger, nullable=True)
 
     def __repr__(self):
         return f"<PriceCache(symbol={self.symbol}, price={self.price}, currency={self.currency}, fetched_at={self.fetched_at})>"
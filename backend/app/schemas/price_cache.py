@@ -14,6 +14,7 @@ class PriceCacheBase(BaseModel):
     price: float
     currency: str
     source: str
+    version: Optional[int] = None
 
 
 # --- Price Cache Creation Schema ---
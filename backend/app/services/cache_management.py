@@ -5,8 +5,9 @@ This service provides consistent cache validation logic across all caching opera
 ensuring that cache TTL settings from .env are respected uniformly.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, select, delete
@@ -50,6 +51,31 @@ def ensure_timezone_aware(dt: Optional[datetime]) -> Optional[datetime]:
     return dt
 
 
+@dataclass(frozen=True)
+class CacheConfig:
+    """Snapshot of the cache settings used by CacheManagementService."""
+
+    price_cache_minutes: int
+    conversion_cache_hours: int
+    price_cache_cleanup_days: int
+    conversion_cache_cleanup_days: int
+
+    @classmethod
+    def from_settings(cls) -> "CacheConfig":
+        """
+        Capture the current cache settings from configuration.
+
+        Returns:
+            CacheConfig: Cache settings read from .env
+        """
+        return cls(
+            price_cache_minutes=settings.PRICE_CACHE_MINUTES,
+            conversion_cache_hours=settings.CONVERSION_CACHE_HOURS,
+            price_cache_cleanup_days=settings.PRICE_CACHE_CLEANUP_DAYS,
+            conversion_cache_cleanup_days=settings.CONVERSION_CACHE_CLEANUP_DAYS,
+        )
+
+
 class CacheManagementService:
     """
     Centralized service for managing cache validation and status across the application.
@@ -61,10 +87,22 @@ class CacheManagementService:
     - Cache statistics tracking and reporting
     """
 
-    def __init__(self):
-        """Initialize the cache management service with default settings."""
-        self._price_cache_minutes = settings.PRICE_CACHE_MINUTES
-        self._conversion_cache_hours = settings.CONVERSION_CACHE_HOURS
+    def __init__(self, config: Optional[CacheConfig] = None):
+        """
+        Initialize the cache management service.
+
+        Args:
+            config: Cache settings to use, read from configuration if not given
+        """
+        self._config = config if config is not None else CacheConfig.from_settings()
+        self._price_cache_minutes = self._config.price_cache_minutes
+        self._conversion_cache_hours = self._config.conversion_cache_hours
+
+        # TTLs precomputed once for the validity checks and expiration times
+        self._price_cache_ttl_seconds = self._price_cache_minutes * 60
+        self._conversion_cache_ttl_seconds = self._conversion_cache_hours * 3600
+        self._price_cache_ttl = timedelta(minutes=self._price_cache_minutes)
+        self._conversion_cache_ttl = timedelta(hours=self._conversion_cache_hours)
 
         # Cache hit/miss tracking
         self._price_cache_hits = 0
@@ -112,8 +150,8 @@ class CacheManagementService:
             return False
 
         # Use environment variable for TTL calculation
-        is_valid = self._is_cache_valid(
-            cached_entry.fetched_at, self._price_cache_minutes
+        is_valid = self._is_within_ttl(
+            cached_entry.fetched_at, self._price_cache_ttl_seconds
         )
 
         # Track cache hit/miss
@@ -138,6 +176,44 @@ class CacheManagementService:
 
         return is_valid
 
+    def partition_valid(self, entries: Iterable[Any]) -> Tuple[List[Any], List[Any]]:
+        """
+        Split price cache entries into valid and expired ones.
+
+        Equivalent to calling is_price_cache_valid on each entry, but the
+        expiry cutoff is computed once for the whole batch.
+
+        Args:
+            entries: Cache entry objects with fetched_at timestamps
+
+        Returns:
+            Tuple of (valid entries, expired or invalid entries)
+        """
+        cutoff = get_utc_now() - self._price_cache_ttl
+        valid = []
+        expired = []
+        for entry in entries:
+            fetched_at = getattr(entry, "fetched_at", None)
+            if fetched_at and ensure_timezone_aware(fetched_at) >= cutoff:
+                valid.append(entry)
+            else:
+                expired.append(entry)
+
+        # Track cache hit/miss
+        self._price_cache_hits += len(valid)
+        self._price_cache_misses += len(expired)
+        try:
+            from app.core.performance_monitoring import record_cache_access
+
+            for _ in valid:
+                record_cache_access("price", True)
+            for _ in expired:
+                record_cache_access("price", False)
+        except ImportError:
+            pass
+
+        return valid, expired
+
     def is_conversion_cache_valid(
         self, cached_entry: Any, force_refresh: bool = False
     ) -> bool:
@@ -178,9 +254,8 @@ class CacheManagementService:
             return False
 
         # Use environment variable for TTL calculation
-        is_valid = self._is_cache_valid(
-            cached_entry.fetched_at,
-            self._conversion_cache_hours * 60,  # Convert hours to minutes
+        is_valid = self._is_within_ttl(
+            cached_entry.fetched_at, self._conversion_cache_ttl_seconds
         )
 
         # Track cache hit/miss
@@ -221,7 +296,7 @@ class CacheManagementService:
         if not cached_entry.fetched_at:
             return None
 
-        return cached_entry.fetched_at + timedelta(minutes=self._price_cache_minutes)
+        return cached_entry.fetched_at + self._price_cache_ttl
 
     def get_conversion_cache_expiration(self, cached_entry: Any) -> Optional[datetime]:
         """
@@ -239,7 +314,7 @@ class CacheManagementService:
         if not cached_entry.fetched_at:
             return None
 
-        return cached_entry.fetched_at + timedelta(hours=self._conversion_cache_hours)
+        return cached_entry.fetched_at + self._conversion_cache_ttl
 
     def get_cache_age_minutes(self, cached_entry: Any) -> Optional[int]:
         """
@@ -335,138 +410,65 @@ class CacheManagementService:
         """
         # Import here to avoid circular dependency
         from app.crud import crud_price_cache
-        from sqlalchemy import select, and_
-        from app.models.price_cache import PriceCache
-        import logging
 
-        logger = logging.getLogger(__name__)
         cache_statuses = []
+        if not assets:
+            return cache_statuses
 
-        # Group assets by type for batch processing
+        # Validate and group assets by type in a single pass, skipping any
+        # entry without an id, symbol and type
         stock_assets = []
         crypto_assets = []
         other_assets = []
 
         for asset in assets:
-            asset_id = asset.get("id")
-            symbol = asset.get("symbol")
+            if not isinstance(asset, dict):
+                continue
             asset_type = asset.get("type")
-
-            if not all([asset_id, symbol, asset_type]):
+            if not (asset_type and asset.get("id") and asset.get("symbol")):
                 continue
 
-            if asset_type.lower() == "stock":
+            asset_type = asset_type.lower()
+            if asset_type == "stock":
                 stock_assets.append(asset)
-            elif asset_type.lower() == "crypto":
+            elif asset_type == "crypto":
                 crypto_assets.append(asset)
             else:
                 other_assets.append(asset)
 
-        # Process stock assets in batch
-        if stock_assets:
-            try:
-                # Get all stock symbols
-                stock_symbols = [asset.get("symbol") for asset in stock_assets]
-
-                # Fetch all cache entries for these symbols in a single query
-                query = (
-                    select(PriceCache)
-                    .where(
-                        and_(
-                            PriceCache.symbol.in_(stock_symbols),
-                            PriceCache.asset_type == "stock",
-                        )
-                    )
-                    .order_by(PriceCache.fetched_at.desc())
-                )
-
-                result = await db.execute(query)
-                cached_entries = result.scalars().all()
-
-                # Create a map of symbol to latest cache entry
-                symbol_to_cache = {}
-                for entry in cached_entries:
-                    if entry.symbol not in symbol_to_cache:
-                        symbol_to_cache[entry.symbol] = entry
-
-                # Process each stock asset
-                for asset in stock_assets:
-                    asset_id = asset.get("id")
-                    symbol = asset.get("symbol")
-
-                    cache_status = {
-                        "asset_id": asset_id,
-                        "symbol": symbol,
-                        "type": "stock",
-                        "cached_at": None,
-                        "cache_ttl_minutes": self._price_cache_minutes,
-                        "is_valid": False,
-                        "expires_at": None,
-                        "force_refresh_requested": force_refresh,
-                    }
-
-                    # Check if we have a cache entry for this symbol
-                    cached_entry = symbol_to_cache.get(symbol)
-                    if cached_entry:
-                        cache_status["cached_at"] = cached_entry.fetched_at.isoformat()
-                        cache_status["is_valid"] = self.is_price_cache_valid(
-                            cached_entry, force_refresh
-                        )
-
-                        # Add cache age information for better reporting
-                        cache_age = self.get_cache_age_minutes(cached_entry)
-                        if cache_age is not None:
-                            cache_status["cache_age_minutes"] = cache_age
-
-                        expiration = self.get_price_cache_expiration(cached_entry)
-                        if expiration:
-                            cache_status["expires_at"] = expiration.isoformat()
-
-                    cache_statuses.append(cache_status)
-            except Exception as e:
-                logger.error(f"Error processing stock assets: {e}")
-                # Fall back to individual processing
-                for asset in stock_assets:
-                    cache_statuses.append(
-                        self._get_single_asset_cache_status(asset, force_refresh)
-                    )
-
-        # Process crypto assets in batch (similar to stocks)
-        if crypto_assets:
+        # Look up the latest cache entry of every stock and crypto asset at once
+        priced_assets = [
+            (asset, asset_type)
+            for asset_type, typed_assets in (
+                ("stock", stock_assets),
+                ("crypto", crypto_assets),
+            )
+            for asset in typed_assets
+        ]
+        if priced_assets:
             try:
-                # Get all crypto symbols
-                crypto_symbols = [asset.get("symbol") for asset in crypto_assets]
-
-                # Fetch all cache entries for these symbols in a single query
-                query = (
-                    select(PriceCache)
-                    .where(
-                        and_(
-                            PriceCache.symbol.in_(crypto_symbols),
-                            PriceCache.asset_type == "crypto",
-                        )
-                    )
-                    .order_by(PriceCache.fetched_at.desc())
+                symbol_to_cache = await crud_price_cache.get_cached_prices_bulk(
+                    db,
+                    (
+                        (asset.get("symbol"), asset_type)
+                        for asset, asset_type in priced_assets
+                    ),
                 )
 
-                result = await db.execute(query)
-                cached_entries = result.scalars().all()
-
-                # Create a map of symbol to latest cache entry
-                symbol_to_cache = {}
-                for entry in cached_entries:
-                    if entry.symbol not in symbol_to_cache:
-                        symbol_to_cache[entry.symbol] = entry
+                # Validate all entries against a single cutoff
+                valid_ids = set()
+                if not force_refresh:
+                    valid_entries, _ = self.partition_valid(symbol_to_cache.values())
+                    valid_ids = {entry.id for entry in valid_entries}
 
-                # Process each crypto asset
-                for asset in crypto_assets:
+                for asset, asset_type in priced_assets:
                     asset_id = asset.get("id")
                     symbol = asset.get("symbol")
 
                     cache_status = {
                         "asset_id": asset_id,
                         "symbol": symbol,
-                        "type": "crypto",
+                        "type": asset_type,
                         "cached_at": None,
                         "cache_ttl_minutes": self._price_cache_minutes,
                         "is_valid": False,
@@ -475,12 +477,10 @@ class CacheManagementService:
                     }
 
                     # Check if we have a cache entry for this symbol
-                    cached_entry = symbol_to_cache.get(symbol)
+                    cached_entry = symbol_to_cache.get((symbol, asset_type))
                     if cached_entry:
                         cache_status["cached_at"] = cached_entry.fetched_at.isoformat()
-                        cache_status["is_valid"] = self.is_price_cache_valid(
-                            cached_entry, force_refresh
-                        )
+                        cache_status["is_valid"] = cached_entry.id in valid_ids
 
                         # Add cache age information for better reporting
                         cache_age = self.get_cache_age_minutes(cached_entry)
@@ -493,12 +493,12 @@ class CacheManagementService:
 
                     cache_statuses.append(cache_status)
             except Exception as e:
-                logger.error(f"Error processing crypto assets: {e}")
+                logger.error(f"Error processing stock and crypto assets: {e}")
                 # Fall back to individual processing
-                for asset in crypto_assets:
-                    cache_statuses.append(
-                        self._get_single_asset_cache_status(asset, force_refresh)
-                    )
+                cache_statuses = [
+                    self._get_single_asset_cache_status(asset, force_refresh)
+                    for asset, _ in priced_assets
+                ]
 
         # Process other assets individually
         for asset in other_assets:
@@ -550,8 +550,8 @@ class CacheManagementService:
         return {
             "price_cache_minutes": self._price_cache_minutes,
             "conversion_cache_hours": self._conversion_cache_hours,
-            "price_cache_cleanup_days": settings.PRICE_CACHE_CLEANUP_DAYS,
-            "conversion_cache_cleanup_days": settings.CONVERSION_CACHE_CLEANUP_DAYS,
+            "price_cache_cleanup_days": self._config.price_cache_cleanup_days,
+            "conversion_cache_cleanup_days": self._config.conversion_cache_cleanup_days,
         }
 
     async def get_cache_stats(self, db: AsyncSession) -> Dict[str, Any]:
@@ -1042,21 +1042,29 @@ class CacheManagementService:
         Returns:
             bool: True if cache is still valid
         """
-        if not fetched_at:
-            return False
+        return self._is_within_ttl(fetched_at, max_age_minutes * 60)
 
-        # Ensure fetched_at is timezone-aware
-        fetched_at = ensure_timezone_aware(fetched_at)
+    def _is_within_ttl(self, fetched_at: datetime, max_age_seconds: float) -> bool:
+        """
+        Check if a cache timestamp is younger than a TTL given in seconds.
 
-        # Get current time with timezone information
-        now = get_utc_now()
+        Uses get_utc_now like the age reporting methods, so validity and age
+        are measured against the same clock.
 
-        # Calculate age using timezone-aware objects
-        age_delta = now - fetched_at
+        Args:
+            fetched_at: When the cache entry was created
+            max_age_seconds: Maximum age in seconds before cache is considered stale
+
+        Returns:
+            bool: True if cache is still valid
+        """
+        if not fetched_at:
+            return False
 
-        age_minutes = age_delta.total_seconds() / 60
+        cutoff = get_utc_now() - timedelta(seconds=max_age_seconds)
 
-        return age_minutes <= max_age_minutes
+        # Naive timestamps are stored in UTC, so they must be made aware first
+        return ensure_timezone_aware(fetched_at) >= cutoff
 
 
 # Global instance
@@ -62,17 +62,11 @@ class ConversionService:
         is_inverse = False
 
         if not force_refresh:
-            # Try direct currency pair first
-            cached_rate = await self._get_cached_rate(db, from_currency, to_currency)
-
-            # If not found, try inverse pair (e.g., USD->EUR becomes EUR->USD with inverted rate)
-            if not cached_rate:
-                inverse_cached_rate = await self._get_cached_rate(
-                    db, to_currency, from_currency
-                )
-                if inverse_cached_rate:
-                    cached_rate = inverse_cached_rate
-                    is_inverse = True
+            # Direct pair, or else the inverse pair (e.g., USD->EUR becomes
+            # EUR->USD with inverted rate), looked up together
+            cached_rate, is_inverse = await self._get_cached_rate(
+                db, from_currency, to_currency
+            )
 
             if cached_rate and (
                 cache_management_service.is_conversion_cache_valid(cached_rate)
@@ -188,25 +182,35 @@ class ConversionService:
 
     async def _get_cached_rate(
         self, db: AsyncSession, from_currency: str, to_currency: str
-    ) -> Optional[object]:
+    ) -> Tuple[Optional[object], bool]:
         """
         Helper method to get cached conversion rate.
 
+        Both directions of the pair are fetched in a single query; the direct
+        pair is preferred over the inverse one.
+
         Args:
             db: Database session
             from_currency: Source currency code
             to_currency: Target currency code
 
         Returns:
-            Cached conversion rate object or None if not found
+            Tuple of the cached conversion rate object (or None if not found)
+            and whether it is for the inverse pair
         """
-        return await crud_conversion_cache.get_cached_conversion_rate(
+        cached_rates = await crud_conversion_cache.get_cached_conversion_rates_batch(
             db=db,
-            from_currency=from_currency,
-            to_currency=to_currency,
+            currency_pairs=[(from_currency, to_currency), (to_currency, from_currency)],
             max_age_hours=999999,  # Get any cached entry regardless of age
         )
 
+        cached_rate = cached_rates.get((from_currency, to_currency))
+        if cached_rate:
+            return cached_rate, False
+
+        cached_rate = cached_rates.get((to_currency, from_currency))
+        return cached_rate, cached_rate is not None
+
     async def convert_amount(
         self,
         db: AsyncSession,
@@ -5,7 +5,7 @@ from typing import Optional
 from sqlalchemy import delete, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import SessionLocal
+from app.db.database import get_session_maker
 from app.models.asset import Asset
 from app.models.conversion_cache import ConversionCache
 from app.models.price_cache import PriceCache
@@ -165,20 +165,8 @@ class DemoService:
             return False
 
         try:
-            async with SessionLocal() as db:
-                # Start transaction
-                async with db.begin():
-                    # Clean up sessions (except current ones might be needed)
-                    await self._cleanup_sessions(db)
-
-                    # Clean up cache tables
-                    await self._cleanup_cache_tables(db)
-
-                    # Clean up assets (preserve the specified asset)
-                    await self._cleanup_assets(db)
-
-                    # Commit transaction
-                    await db.commit()
+            async with get_session_maker()() as db:
+                await self._cleanup_database(db)
 
                 logger.info(
                     f"Database cleanup completed, preserved asset ID {self.preserve_asset_id}"
@@ -189,6 +177,80 @@ class DemoService:
             logger.error(f"Database cleanup failed: {e}")
             return False
 
+    async def cleanup_database_with_retry(
+        self, max_retries: int = 3, base_delay: int = 300
+    ) -> bool:
+        """
+        Perform database cleanup, retrying failed attempts with exponential backoff.
+        All attempts share a single database session, which holds no connection
+        while waiting between attempts.
+
+        The backoff sleeps inline, so with the defaults a failing cleanup takes
+        over 15 minutes to return; callers should run it in its own task.
+
+        Args:
+            max_retries: Maximum number of cleanup attempts
+            base_delay: Seconds to wait before the first retry, doubled after each
+
+        Returns:
+            True if an attempt succeeded, False if all attempts failed
+        """
+        if not auth_settings.DEMO_MODE:
+            logger.warning("Attempted to cleanup database when not in demo mode")
+            return False
+
+        retry_delay = base_delay
+        async with get_session_maker()() as db:
+            for attempt in range(1, max_retries + 1):
+                logger.info(
+                    f"Starting demo mode database cleanup (attempt {attempt}/{max_retries})"
+                )
+                try:
+                    await self._cleanup_database(db)
+
+                    logger.info(
+                        f"Database cleanup completed, preserved asset ID {self.preserve_asset_id}"
+                    )
+                    return True
+                except Exception as e:
+                    logger.error(
+                        f"Database cleanup attempt {attempt} failed: {e}",
+                        extra={
+                            "event_type": "demo_cleanup_error",
+                            "attempt": attempt,
+                            "error": str(e),
+                        },
+                    )
+
+                # If this is not the last attempt, wait before retrying
+                if attempt < max_retries:
+                    logger.info(f"Waiting {retry_delay} seconds before retry...")
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2  # Exponential backoff
+
+        return False
+
+    async def _cleanup_database(self, db: AsyncSession) -> None:
+        """
+        Remove all data except the preserved asset in a single transaction.
+
+        Args:
+            db: Database session
+        """
+        # Start transaction
+        async with db.begin():
+            # Clean up sessions (except current ones might be needed)
+            await self._cleanup_sessions(db)
+
+            # Clean up cache tables
+            await self._cleanup_cache_tables(db)
+
+            # Clean up assets (preserve the specified asset)
+            await self._cleanup_assets(db)
+
+            # Commit transaction
+            await db.commit()
+
     async def _cleanup_sessions(self, db: AsyncSession) -> None:
         """
         Clean up expired and old sessions.
@@ -286,7 +348,7 @@ class DemoService:
             return
 
         try:
-            async with SessionLocal() as db:
+            async with get_session_maker()() as db:
                 # Check if the preserved asset exists
                 result = await db.execute(
                     select(Asset).where(Asset.id == self.preserve_asset_id)
@@ -51,9 +51,20 @@ async def get_price_cache_batch(
     # Calculate cutoff time for cache validity
     cutoff_time = get_utc_now() - timedelta(minutes=max_age_minutes)
 
-    # Use a subquery to get the latest entry for each symbol
-    subquery = (
-        select(PriceCache.symbol, func.max(PriceCache.fetched_at).label("latest_fetch"))
+    # Rank each symbol's entries newest fetch first (by version, then fetch time)
+    ranked = (
+        select(
+            PriceCache.id,
+            func.row_number()
+            .over(
+                partition_by=PriceCache.symbol,
+                order_by=(
+                    PriceCache.version.desc().nulls_last(),
+                    PriceCache.fetched_at.desc(),
+                ),
+            )
+            .label("rank"),
+        )
         .where(
             and_(
                 PriceCache.symbol.in_(symbols),
@@ -61,17 +72,14 @@ async def get_price_cache_batch(
                 PriceCache.fetched_at >= cutoff_time,
             )
         )
-        .group_by(PriceCache.symbol)
         .subquery()
     )
 
     # Join with the main table to get the full entries
-    query = select(PriceCache).join(
-        subquery,
-        and_(
-            PriceCache.symbol == subquery.c.symbol,
-            PriceCache.fetched_at == subquery.c.latest_fetch,
-        ),
+    query = (
+        select(PriceCache)
+        .join(ranked, PriceCache.id == ranked.c.id)
+        .where(ranked.c.rank == 1)
     )
 
     # Execute the query
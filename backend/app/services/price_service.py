@@ -1,13 +1,23 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.crud import crud_price_cache
+from app.db.database import get_session_maker
+from app.crud import crud_price_cache, crud_isin_symbol_map
 from app.core.config import settings
 from app.services.cache_management import cache_management_service
+from app.utils.graceful_degradation import CircuitOpenError, get_circuit_breaker
 import finnhub
 import yfinance as yf
 import httpx
-from typing import Dict, Optional
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of price lookups run at the same time by get_prices
+PRICE_FETCH_CONCURRENCY = 10
+
 
 class PriceService:
     """
@@ -22,12 +32,26 @@ class PriceService:
         else:
             self.finnhub_client = None
 
+        # Circuit breakers let us skip an upstream that is failing instead of
+        # waiting for its timeout on every request
+        self._breakers = {
+            "finnhub": get_circuit_breaker("finnhub"),
+            "yahoo_finance": get_circuit_breaker("yahoo_finance"),
+            "coingecko": get_circuit_breaker("coingecko"),
+        }
+
+        # Identifiers with a background refresh in flight, and the tasks
+        # themselves so they are not garbage collected while running
+        self._revalidating: set = set()
+        self._background_tasks: set = set()
+
     async def get_stock_price(
         self,
         db: AsyncSession,
         identifier: str,
         force_refresh: bool = False,
         allow_expired: bool = False,
+        stale_while_revalidate: bool = False,
     ) -> Dict[str, any]:
         """
         Get stock price with caching.
@@ -36,6 +60,9 @@ class PriceService:
             db: Database session
             identifier: Stock symbol or ISIN
             force_refresh: If True, bypass cache and fetch fresh data
+            allow_expired: If True, allow expired cache data
+            stale_while_revalidate: If True, return an expired cache entry
+                straight away and refresh it in the background
 
         Returns:
             Dict with symbol, price, currency, cache info, and expiration details
@@ -48,17 +75,19 @@ class PriceService:
             )
 
             # Use centralized cache validation
-            if cached_price and (
+            is_valid = cached_price is not None and (
                 cache_management_service.is_price_cache_valid(cached_price)
-                or allow_expired
-            ):
+            )
+            if cached_price and (is_valid or allow_expired or stale_while_revalidate):
                 cache_expiration = cache_management_service.get_price_cache_expiration(
                     cached_price
                 )
                 cache_age = cache_management_service.get_cache_age_minutes(cached_price)
-                is_valid = cache_management_service.is_price_cache_valid(cached_price)
+                stale = not is_valid and not allow_expired
+                if stale:
+                    self._revalidate_stock_price(identifier)
 
-                return {
+                response = {
                     "symbol": cached_price.symbol,
                     "price": cached_price.price,
                     "currency": cached_price.currency,
@@ -78,68 +107,110 @@ class PriceService:
                         "using_expired_cache": allow_expired and not is_valid,
                     },
                 }
+                # Only stale-while-revalidate responses carry the stale flag
+                if stale:
+                    response["stale"] = True
+                return response
 
         # Fetch fresh data
         symbol = identifier
         price = None
         currency = None
         source = None
+        finnhub_breaker = self._breakers["finnhub"]
+        yahoo_breaker = self._breakers["yahoo_finance"]
 
         # If identifier looks like an ISIN (12 alphanumeric chars), search for symbol
         if len(identifier) == 12 and identifier.isalnum():
-            # Try Finnhub first
+            # ISIN -> symbol mappings are stable, so reuse a previous lookup
+            resolved_symbol = None
             if self.finnhub_client:
+                resolved_symbol = await crud_isin_symbol_map.get_symbol_for_isin(
+                    db=db, isin=identifier
+                )
+
+            # Try Finnhub first
+            if self.finnhub_client and finnhub_breaker.allow_request():
+                looked_up = False
                 try:
-                    search_result = self.finnhub_client.symbol_lookup(identifier)
-                    if search_result and search_result.get("count", 0) > 0:
-                        symbol = search_result["result"][0]["symbol"]
-                        quote = self.finnhub_client.quote(symbol)
+                    if resolved_symbol is None:
+                        search_result = await asyncio.to_thread(
+                            self.finnhub_client.symbol_lookup, identifier
+                        )
+                        if search_result and search_result.get("count", 0) > 0:
+                            resolved_symbol = search_result["result"][0]["symbol"]
+                            looked_up = True
+                    if resolved_symbol:
+                        symbol = resolved_symbol
+                        quote = await asyncio.to_thread(
+                            self.finnhub_client.quote, symbol
+                        )
                         price = quote.get("c")
                         if price is not None and price != 0:
                             currency = "USD"
                             source = "finnhub"
+                    finnhub_breaker.record_success()
                 except Exception as e:
-                    print(f"[PriceService] Finnhub error for ISIN {identifier}: {e}")
+                    finnhub_breaker.record_failure()
+                    logger.warning("Finnhub error for ISIN %s: %s", identifier, e)
+
+                # Remember a fresh lookup; a database error here is not a
+                # Finnhub failure and must not cost us the price
+                if looked_up:
+                    try:
+                        await crud_isin_symbol_map.save_isin_symbol(
+                            db=db, isin=identifier, symbol=resolved_symbol
+                        )
+                    except Exception as e:
+                        await db.rollback()
+                        logger.warning(
+                            "Could not store symbol for ISIN %s: %s", identifier, e
+                        )
 
             # Fallback to Yahoo Finance
-            if price is None:
+            if price is None and yahoo_breaker.allow_request():
                 try:
                     ticker = yf.Ticker(identifier)
-                    info = ticker.info
+                    info = await asyncio.to_thread(lambda: ticker.info)
                     price = info.get("regularMarketPrice")
                     currency = info.get("currency", "USD")
                     if price is not None:
                         source = "yfinance"
                         symbol = identifier
+                    yahoo_breaker.record_success()
                 except Exception as e:
-                    print(
-                        f"[PriceService] Yahoo Finance error for ISIN {identifier}: {e}"
-                    )
+                    yahoo_breaker.record_failure()
+                    logger.warning("Yahoo Finance error for ISIN %s: %s", identifier, e)
         else:
             # Regular symbol - try Finnhub first
-            if self.finnhub_client:
+            if self.finnhub_client and finnhub_breaker.allow_request():
                 try:
-                    quote = self.finnhub_client.quote(symbol)
+                    quote = await asyncio.to_thread(self.finnhub_client.quote, symbol)
                     price = quote.get("c")
                     if price is not None and price != 0:
                         currency = "USD"
                         source = "finnhub"
+                    finnhub_breaker.record_success()
                 except Exception as e:
-                    print(f"[PriceService] Finnhub error for symbol {symbol}: {e}")
+                    finnhub_breaker.record_failure()
+                    logger.warning("Finnhub error for symbol %s: %s", symbol, e)
 
             # Fallback to Yahoo Finance
-            if price is None:
+            if price is None and yahoo_breaker.allow_request():
                 try:
                     ticker = yf.Ticker(symbol)
-                    info = ticker.info
+                    info = await asyncio.to_thread(lambda: ticker.info)
                     price = info.get("regularMarketPrice")
                     currency = info.get("currency", "USD")
                     if price is not None:
                         source = "yfinance"
+                    yahoo_breaker.record_success()
                 except Exception as e:
-                    print(
-                        f"[PriceService] Yahoo Finance error for symbol {symbol}: {e}"
-                    )
+                    yahoo_breaker.record_failure()
+                    logger.warning("Yahoo Finance error for symbol %s: %s", symbol, e)
+
+        # Stamp the fetch time before touching the database again
+        version = time.time_ns()
 
         # Handle API failure scenarios with cache fallback
         if price is None:
@@ -181,6 +252,7 @@ class PriceService:
             price=price,
             currency=currency,
             source=source,
+            version=version,
         )
 
         # Calculate cache expiration for fresh data
@@ -204,6 +276,44 @@ class PriceService:
             },
         }
 
+    def _revalidate_stock_price(self, identifier: str) -> None:
+        """
+        Refresh a stock price in the background, at most once at a time.
+
+        Args:
+            identifier: Stock symbol or ISIN
+        """
+        if identifier in self._revalidating:
+            return
+
+        self._revalidating.add(identifier)
+        task = asyncio.create_task(self._refresh_stock_price(identifier))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _refresh_stock_price(self, identifier: str) -> None:
+        """
+        Fetch and cache a fresh stock price, keeping the stale entry on failure.
+
+        Uses its own session since the request that triggered it may already
+        be finished.
+
+        Args:
+            identifier: Stock symbol or ISIN
+        """
+        session_maker = get_session_maker()
+        try:
+            async with session_maker() as db:
+                await self.get_stock_price(db, identifier, force_refresh=True)
+        except Exception as e:
+            logger.warning(
+                "Background refresh failed for stock %s, keeping stale price: %s",
+                identifier,
+                e,
+            )
+        finally:
+            self._revalidating.discard(identifier)
+
     async def get_crypto_price(
         self,
         db: AsyncSession,
@@ -318,15 +428,27 @@ class PriceService:
                     },
                 }
 
-        # Fetch fresh data from CoinGecko
+        # Fetch fresh data from CoinGecko, unless its circuit breaker is open
+        coingecko_breaker = self._breakers["coingecko"]
         try:
+            if not coingecko_breaker.allow_request():
+                raise CircuitOpenError("Circuit breaker 'coingecko' is open")
+
             async with httpx.AsyncClient() as client:
                 # Use CoinGecko API (free tier) with proper ID mapping
                 url = f"https://api.coingecko.com/api/v3/simple/price?ids={coingecko_id}&vs_currencies=usd"
-                response = await client.get(url)
-
-                if response.status_code == 200:
+                try:
+                    response = await client.get(url)
+                except httpx.HTTPError:
+                    coingecko_breaker.record_failure()
+                    raise
+
+                if response.status_code != 200:
+                    coingecko_breaker.record_failure()
+                else:
+                    coingecko_breaker.record_success()
                     data = response.json()
+                    version = time.time_ns()
                     if coingecko_id in data and "usd" in data[coingecko_id]:
                         price = data[coingecko_id]["usd"]
                         currency = "USD"
@@ -340,6 +462,7 @@ class PriceService:
                             price=price,
                             currency=currency,
                             source=source,
+                            version=version,
                         )
 
                         # Calculate cache expiration for fresh data
@@ -365,7 +488,7 @@ class PriceService:
                             },
                         }
         except Exception as e:
-            print(f"[PriceService] CoinGecko error for {symbol}: {e}")
+            logger.warning("CoinGecko error for %s: %s", symbol, e)
 
         # Handle API failure scenarios with cache fallback
         # Try to fall back to any cached data (even if expired)
@@ -461,6 +584,7 @@ class PriceService:
         # Fetch fresh data from Onvista
         try:
             onvista_data = await onvista_service.get_instrument_data(isin)
+            version = time.time_ns()
             if onvista_data:
                 price = onvista_data["price"]
                 currency = onvista_data["currency"]
@@ -474,6 +598,7 @@ class PriceService:
                     price=price,
                     currency=currency,
                     source="onvista",
+                    version=version,
                 )
 
                 cache_expiration = now + timedelta(minutes=settings.PRICE_CACHE_MINUTES)
@@ -495,7 +620,7 @@ class PriceService:
                     },
                 }
         except Exception as e:
-            print(f"[PriceService] Onvista error for {isin}: {e}")
+            logger.warning("Onvista error for %s: %s", isin, e)
 
         # Handle API failure scenarios with cache fallback
         # Try to fall back to any cached data (even if expired)
@@ -528,6 +653,94 @@ class PriceService:
                 f"Could not fetch price for derivative {isin} and no cached data available"
             )
 
+    async def get_price(
+        self,
+        db: AsyncSession,
+        asset_type: str,
+        identifier: str,
+        force_refresh: bool = False,
+        allow_expired: bool = False,
+    ) -> Dict[str, any]:
+        """
+        Get a price by asset type, dispatching to the matching getter.
+
+        Args:
+            db: Database session
+            asset_type: One of 'stock', 'crypto' or 'derivative'
+            identifier: Symbol or ISIN of the asset
+            force_refresh: If True, bypass cache and fetch fresh data
+            allow_expired: If True, allow expired cache data
+
+        Returns:
+            Dict with symbol, price, currency and cache info
+        """
+        if asset_type == "stock":
+            return await self.get_stock_price(
+                db=db,
+                identifier=identifier,
+                force_refresh=force_refresh,
+                allow_expired=allow_expired,
+            )
+        if asset_type == "crypto":
+            return await self.get_crypto_price(
+                db=db,
+                symbol=identifier,
+                force_refresh=force_refresh,
+                allow_expired=allow_expired,
+            )
+        if asset_type == "derivative":
+            return await self.get_derivative_price(
+                db=db,
+                isin=identifier,
+                force_refresh=force_refresh,
+                allow_expired=allow_expired,
+            )
+        raise ValueError(f"Unsupported asset type for pricing: {asset_type}")
+
+    async def get_prices(
+        self,
+        requests: List[Tuple[str, str]],
+        force_refresh: bool = False,
+        allow_expired: bool = False,
+    ) -> List[Union[Dict[str, any], Exception]]:
+        """
+        Get prices for several assets concurrently.
+
+        Lookups run in parallel, at most PRICE_FETCH_CONCURRENCY at a time, and
+        duplicate requests are only fetched once. Each lookup uses its own
+        database session since an AsyncSession cannot be shared between tasks.
+
+        Args:
+            requests: List of (asset_type, identifier) pairs
+            force_refresh: If True, bypass cache and fetch fresh data
+            allow_expired: If True, allow expired cache data
+
+        Returns:
+            List of results in the same order as requests. A failed lookup is
+            returned as the exception it raised.
+        """
+        semaphore = asyncio.Semaphore(PRICE_FETCH_CONCURRENCY)
+        session_maker = get_session_maker()
+        unique_requests = list(dict.fromkeys(requests))
+
+        async def fetch(asset_type: str, identifier: str) -> Dict[str, any]:
+            async with semaphore:
+                async with session_maker() as db:
+                    return await self.get_price(
+                        db=db,
+                        asset_type=asset_type,
+                        identifier=identifier,
+                        force_refresh=force_refresh,
+                        allow_expired=allow_expired,
+                    )
+
+        results = await asyncio.gather(
+            *(fetch(*request) for request in unique_requests),
+            return_exceptions=True,
+        )
+        results_by_request = dict(zip(unique_requests, results))
+        return [results_by_request[request] for request in requests]
+
 
 # Global instance
 price_service = PriceService()
@@ -6,34 +6,93 @@ maintenance operations like cache cleanup and session management.
 """
 
 import asyncio
+import heapq
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any
+import time
+from datetime import datetime, time as dt_time, timedelta, timezone
+from functools import cached_property
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from sqlalchemy import and_, bindparam, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.database import get_db
+from app.db.database import get_session_maker
+from app.core.auth_config import auth_settings
 from app.core.config import settings
 from app.crud import crud_price_cache, crud_conversion_cache
+from app.models.session import Session
+from app.services.auth_service import auth_service
+from app.services.demo_service import demo_service
 
 logger = logging.getLogger(__name__)
 
+# Hours between cache cleanups (price and conversion caches run together)
+CACHE_CLEANUP_INTERVAL_HOURS = 24
+
+# Hours between session cleanups
+SESSION_CLEANUP_INTERVAL_HOURS = 1
+
+# Seconds to wait before retrying a scheduled job that raised an error
+JOB_RETRY_SECONDS = {
+    "cache_cleanup": 3600,  # 1 hour
+    "session_cleanup": 1800,  # 30 minutes
+    "demo_cleanup": 3600,  # 1 hour
+}
+
+# Number of cache entries deleted per transaction during cleanup
+CACHE_CLEANUP_BATCH_SIZE = 5000
+
+# Demo cleanup attempts per day and delay before the first retry (doubled after each)
+DEMO_CLEANUP_MAX_RETRIES = 3
+DEMO_CLEANUP_RETRY_DELAY_SECONDS = 300
+
+# Longest single sleep of the scheduler; long waits are split so the event loop
+# clock is re-read regularly instead of trusting one multi-hour sleep
+MAX_SCHEDULER_SLEEP_SECONDS = 3600
+
+# Seconds to wait for the scheduler task to finish when stopping
+SHUTDOWN_TIMEOUT_SECONDS = 5
+
+# Seconds session statistics are served from memory before being recomputed
+SESSION_STATS_CACHE_SECONDS = 30
+
+# Total, active and expired session counts, all evaluated against :now
+_SESSION_STATS_STMT = select(
+    func.count(Session.id),
+    func.sum(
+        case(
+            (and_(Session.is_active == True, Session.expires_at > bindparam("now")), 1),
+            else_=0,
+        )
+    ),
+    func.sum(case((Session.expires_at <= bindparam("now"), 1), else_=0)),
+)
+
 
 class ScheduledTaskManager:
     """
     Manager for scheduled background tasks.
 
     This class handles the scheduling and execution of background tasks
-    like cache cleanup and session management.
+    like cache cleanup and session management. A single scheduler task sleeps
+    until the earliest scheduled job is due, then starts the job in its own
+    task so a slow job does not hold up the others.
     """
 
     def __init__(self):
         """Initialize the scheduled task manager."""
-        self._cleanup_task: Optional[asyncio.Task] = None
-        self._session_cleanup_task: Optional[asyncio.Task] = None
-        self._demo_cleanup_task: Optional[asyncio.Task] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
+        # Heap of (event loop time the job is due, job name)
+        self._schedule: List[Tuple[float, str]] = []
+        self._jobs: Set[str] = set()
+        # Jobs currently running, and an event set when one reschedules itself
+        self._job_tasks: Set[asyncio.Task] = set()
+        self._wakeup: Optional[asyncio.Event] = None
         self._running = False
         self._last_cleanup: Optional[datetime] = None
         self._last_session_cleanup: Optional[datetime] = None
         self._last_demo_cleanup: Optional[datetime] = None
+        self._last_demo_cleanup_date: Optional[str] = None
+        # (monotonic time computed, statistics) for get_session_statistics
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
     async def start_scheduled_tasks(self):
         """Start all scheduled tasks."""
@@ -42,14 +101,28 @@ class ScheduledTaskManager:
             return
 
         self._running = True
-        self._cleanup_task = asyncio.create_task(self._run_periodic_cache_cleanup())
-        self._session_cleanup_task = asyncio.create_task(
-            self._run_periodic_session_cleanup()
-        )
-        self._demo_cleanup_task = asyncio.create_task(self._run_periodic_demo_cleanup())
-        logger.info(
-            "Started scheduled tasks (cache cleanup, session management, and demo mode cleanup)"
-        )
+        self._schedule = []
+        self._jobs = set()
+        self._wakeup = asyncio.Event()
+
+        # Cache and session cleanup run immediately, then periodically
+        now = asyncio.get_running_loop().time()
+        self._schedule_job("cache_cleanup", now)
+
+        # Session cleanup only has work to do when authentication is enabled
+        if auth_settings.auth_enabled:
+            self._schedule_job("session_cleanup", now)
+
+        # Demo cleanup runs daily at the configured time
+        if auth_settings.DEMO_MODE:
+            seconds_until_cleanup = self._calculate_seconds_until_demo_cleanup()
+            logger.debug(f"Next demo cleanup in {seconds_until_cleanup} seconds")
+            self._schedule_job("demo_cleanup", now + seconds_until_cleanup)
+        else:
+            logger.debug("Demo mode not enabled, demo cleanup task will not run")
+
+        self._scheduler_task = asyncio.create_task(self._run_scheduler())
+        logger.info(f"Started scheduled tasks ({', '.join(sorted(self._jobs))})")
 
     async def stop_scheduled_tasks(self):
         """Stop all scheduled tasks."""
@@ -57,89 +130,160 @@ class ScheduledTaskManager:
             logger.warning("Scheduled tasks are not running")
             return
 
-        # Cancel cache cleanup task
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
-            self._cleanup_task = None
-
-        # Cancel session cleanup task
-        if self._session_cleanup_task:
-            self._session_cleanup_task.cancel()
-            try:
-                await self._session_cleanup_task
-            except asyncio.CancelledError:
-                pass
-            self._session_cleanup_task = None
-
-        # Cancel demo cleanup task
-        if self._demo_cleanup_task:
-            self._demo_cleanup_task.cancel()
-            try:
-                await self._demo_cleanup_task
-            except asyncio.CancelledError:
-                pass
-            self._demo_cleanup_task = None
+        # Cancel the scheduler and any running jobs, bounding how long shutdown
+        # waits for them
+        tasks = list(self._job_tasks)
+        if self._scheduler_task:
+            tasks.append(self._scheduler_task)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT_SECONDS)
+            if pending:
+                logger.warning(
+                    f"Scheduled tasks did not stop within {SHUTDOWN_TIMEOUT_SECONDS}s"
+                )
+        self._scheduler_task = None
 
+        self._schedule = []
+        self._jobs = set()
+        self._job_tasks = set()
+        self._wakeup = None
         self._running = False
         logger.info("Stopped scheduled tasks")
 
-    async def _run_periodic_cache_cleanup(self):
-        """Run cache cleanup periodically."""
-        # Get cleanup intervals from settings
-        price_cleanup_interval_hours = 24  # Run price cache cleanup once a day
-        conversion_cleanup_interval_hours = (
-            24  # Run conversion cache cleanup once a day
-        )
+    def _schedule_job(self, name: str, due: float):
+        """
+        Add a job to the schedule.
+
+        Args:
+            name: Name of the job
+            due: Event loop time at which the job should run
+        """
+        heapq.heappush(self._schedule, (due, name))
+        self._jobs.add(name)
 
+    async def _run_scheduler(self):
+        """Start scheduled jobs in order of their due time."""
+        loop = asyncio.get_running_loop()
         try:
             while True:
-                try:
-                    # Run cache cleanup
-                    await self._cleanup_cache()
-                    self._last_cleanup = datetime.utcnow()
-
-                    # Sleep until next cleanup
-                    # We use the shorter interval to ensure both caches are cleaned up regularly
-                    sleep_interval = min(
-                        price_cleanup_interval_hours, conversion_cleanup_interval_hours
-                    )
-                    await asyncio.sleep(
-                        sleep_interval * 3600
-                    )  # Convert hours to seconds
-                except Exception as e:
-                    logger.error(f"Error in cache cleanup task: {e}")
-                    # Sleep for a while before retrying
-                    await asyncio.sleep(3600)  # 1 hour
+                # Running jobs reschedule themselves when they finish, possibly
+                # ahead of the job currently at the top of the heap
+                self._wakeup.clear()
+                if not self._schedule:
+                    await self._wakeup.wait()
+                    continue
+
+                due, name = self._schedule[0]
+                remaining = due - loop.time()
+                if remaining > 0:
+                    # Sleep until the deadline in bounded chunks
+                    try:
+                        await asyncio.wait_for(
+                            self._wakeup.wait(),
+                            timeout=min(remaining, MAX_SCHEDULER_SLEEP_SECONDS),
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                heapq.heappop(self._schedule)
+                task = asyncio.create_task(self._run_and_reschedule(name))
+                self._job_tasks.add(task)
+                task.add_done_callback(self._job_tasks.discard)
         except asyncio.CancelledError:
-            logger.info("Cache cleanup task cancelled")
+            logger.info("Scheduled tasks cancelled")
             raise
 
-    async def _cleanup_cache(self):
-        """Clean up expired cache entries."""
-        # Removed noisy "Starting cache cleanup" log
+    async def _run_and_reschedule(self, name: str):
+        """
+        Run a scheduled job and put it back on the schedule once it finishes.
+
+        Args:
+            name: Name of the job
+        """
+        try:
+            next_run_seconds = await self._run_job(name)
+        except Exception as e:
+            logger.error(f"Error in {name} task: {e}")
+            # Wait a while before retrying
+            next_run_seconds = JOB_RETRY_SECONDS[name]
+        self._schedule_job(name, asyncio.get_running_loop().time() + next_run_seconds)
+        self._wakeup.set()
+
+    async def _run_job(self, name: str) -> float:
+        """
+        Run a single scheduled job.
+
+        Args:
+            name: Name of the job
+
+        Returns:
+            Seconds until the job should run again
+        """
+        if name == "cache_cleanup":
+            if await self._cleanup_cache() is not None:
+                self._last_cleanup = datetime.now(timezone.utc)
+            return CACHE_CLEANUP_INTERVAL_HOURS * 3600
+
+        if name == "session_cleanup":
+            await self._cleanup_sessions()
+            self._last_session_cleanup = datetime.now(timezone.utc)
+            return SESSION_CLEANUP_INTERVAL_HOURS * 3600
+
+        if name == "demo_cleanup":
+            await self._perform_demo_cleanup()
+            self._last_demo_cleanup = datetime.now(timezone.utc)
+            seconds_until_cleanup = self._calculate_seconds_until_demo_cleanup()
+            logger.debug(f"Next demo cleanup in {seconds_until_cleanup} seconds")
+            return seconds_until_cleanup
+
+        raise ValueError(f"Unknown scheduled job: {name}")
+
+    async def _cleanup_cache(self) -> Optional[Dict[str, Any]]:
+        """
+        Clean up expired cache entries.
+
+        Returns:
+            Cleanup summary, or None if a cleanup already ran within the
+            current interval
+        """
+        now = datetime.now(timezone.utc)
+
+        # Skip if a cleanup already ran recently
+        if self._last_cleanup:
+            seconds_since_cleanup = (now - self._last_cleanup).total_seconds()
+            if seconds_since_cleanup < CACHE_CLEANUP_INTERVAL_HOURS * 3600 * 0.9:
+                logger.debug("Cache cleanup ran recently, skipping")
+                return None
 
         # Get database session
-        async for db in get_db():
+        async with get_session_maker()() as db:
             try:
-                # Clean up price cache
+                # Clean up price cache, only deleting if anything has expired
                 price_cleanup_days = settings.PRICE_CACHE_CLEANUP_DAYS
-                price_entries_cleared = (
-                    await crud_price_cache.cleanup_old_cache_entries(
-                        db=db, max_age_days=price_cleanup_days
+                price_entries_cleared = 0
+                if await crud_price_cache.has_old_cache_entries(
+                    db=db, max_age_days=price_cleanup_days
+                ):
+                    price_entries_cleared = await self._delete_in_batches(
+                        crud_price_cache.cleanup_old_cache_entries,
+                        db=db,
+                        max_age_days=price_cleanup_days,
                     )
-                )
 
-                # Clean up conversion cache
+                # Clean up conversion cache, only deleting if anything has expired
                 conversion_cleanup_days = settings.CONVERSION_CACHE_CLEANUP_DAYS
-                conversion_entries_cleared = (
-                    await crud_conversion_cache.cleanup_old_conversion_cache_entries(
-                        db=db, max_age_days=conversion_cleanup_days
+                conversion_entries_cleared = 0
+                if await crud_conversion_cache.has_old_conversion_cache_entries(
+                    db=db, max_age_days=conversion_cleanup_days
+                ):
+                    conversion_entries_cleared = await self._delete_in_batches(
+                        crud_conversion_cache.cleanup_old_conversion_cache_entries,
+                        db=db,
+                        max_age_days=conversion_cleanup_days,
                     )
-                )
 
                 # Only log if entries were actually cleared (reduce noise)
                 if price_entries_cleared > 0:
@@ -154,47 +298,51 @@ class ScheduledTaskManager:
                 return {
                     "price_entries_cleared": price_entries_cleared,
                     "conversion_entries_cleared": conversion_entries_cleared,
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now.isoformat(),
                 }
             except Exception as e:
                 logger.error(f"Error during cache cleanup: {e}")
                 raise
 
-    async def _run_periodic_session_cleanup(self):
-        """Run session cleanup periodically."""
-        # Session cleanup runs every hour
-        session_cleanup_interval_hours = 1
+    async def _delete_in_batches(
+        self,
+        cleanup: Callable[..., Awaitable[int]],
+        db: AsyncSession,
+        max_age_days: int,
+    ) -> int:
+        """
+        Run a CRUD cleanup function repeatedly in bounded batches.
+
+        Args:
+            cleanup: CRUD cleanup function accepting db, max_age_days and limit
+            db: Database session
+            max_age_days: Maximum age of entries to keep
+
+        Returns:
+            Total number of deleted entries
+        """
+        total_deleted = 0
+        while True:
+            deleted = await cleanup(
+                db=db, max_age_days=max_age_days, limit=CACHE_CLEANUP_BATCH_SIZE
+            )
+            total_deleted += deleted
+            if deleted < CACHE_CLEANUP_BATCH_SIZE:
+                return total_deleted
 
-        try:
-            while True:
-                try:
-                    # Run session cleanup
-                    await self._cleanup_sessions()
-                    self._last_session_cleanup = datetime.utcnow()
-
-                    # Sleep until next cleanup
-                    await asyncio.sleep(
-                        session_cleanup_interval_hours * 3600
-                    )  # Convert hours to seconds
-                except Exception as e:
-                    logger.error(f"Error in session cleanup task: {e}")
-                    # Sleep for a while before retrying
-                    await asyncio.sleep(1800)  # 30 minutes
-        except asyncio.CancelledError:
-            logger.info("Session cleanup task cancelled")
-            raise
+            # Let other tasks run between batches
+            await asyncio.sleep(0)
 
     async def _cleanup_sessions(self):
         """Clean up expired and inactive sessions."""
-        from app.services.auth_service import auth_service
-        from app.core.auth_config import auth_settings
-
         # Only run session cleanup if authentication is enabled
         if not auth_settings.auth_enabled:
             return
 
+        now_iso = datetime.now(timezone.utc).isoformat()
+
         # Get database session
-        async for db in get_db():
+        async with get_session_maker()() as db:
             try:
                 # Clean up expired sessions
                 expired_sessions_cleared = await auth_service.cleanup_expired_sessions(
@@ -222,55 +370,53 @@ class ScheduledTaskManager:
                             "active_sessions_remaining": security_info.get(
                                 "active_sessions", 0
                             ),
-                            "timestamp": datetime.utcnow().isoformat(),
+                            "timestamp": now_iso,
                         },
                     )
 
+                # Cached session statistics no longer reflect the table
+                self._stats_cache = None
+
                 return {
                     "expired_sessions_cleared": expired_sessions_cleared,
                     "inactive_sessions_cleared": inactive_sessions_cleared,
                     "total_sessions_cleared": total_cleared,
                     "security_info": security_info,
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now_iso,
                 }
             except Exception as e:
                 logger.error(f"Error during session cleanup: {e}")
                 raise
 
     async def get_session_statistics(self) -> Dict[str, Any]:
-        """Get session statistics for monitoring purposes."""
-        from app.services.auth_service import auth_service
-        from app.core.auth_config import auth_settings
-        from sqlalchemy import select, func
-        from app.models.session import Session
+        """
+        Get session statistics for monitoring purposes.
 
+        Results are cached for SESSION_STATS_CACHE_SECONDS so frequent
+        monitoring polls do not each hit the database.
+        """
         if not auth_settings.auth_enabled:
             return {"auth_enabled": False}
 
-        async for db in get_db():
-            try:
-                # Count total sessions
-                total_sessions_result = await db.execute(select(func.count(Session.id)))
-                total_sessions = total_sessions_result.scalar()
-
-                # Count active sessions
-                active_sessions_result = await db.execute(
-                    select(func.count(Session.id)).where(
-                        Session.is_active == True,
-                        Session.expires_at > datetime.utcnow(),
-                    )
-                )
-                active_sessions = active_sessions_result.scalar()
+        if self._stats_cache is not None:
+            computed_at, cached_stats = self._stats_cache
+            if time.monotonic() - computed_at < SESSION_STATS_CACHE_SECONDS:
+                return dict(cached_stats)
 
-                # Count expired sessions
-                expired_sessions_result = await db.execute(
-                    select(func.count(Session.id)).where(
-                        Session.expires_at <= datetime.utcnow()
-                    )
-                )
-                expired_sessions = expired_sessions_result.scalar()
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
 
-                return {
+        async with get_session_maker()() as db:
+            try:
+                # Count total, active and expired sessions in a single query,
+                # evaluated against the same instant
+                stats_result = await db.execute(_SESSION_STATS_STMT, {"now": now})
+                total_sessions, active_sessions, expired_sessions = stats_result.one()
+                # SUM over an empty table is NULL
+                active_sessions = active_sessions or 0
+                expired_sessions = expired_sessions or 0
+
+                stats = {
                     "auth_enabled": True,
                     "total_sessions": total_sessions,
                     "active_sessions": active_sessions,
@@ -280,68 +426,36 @@ class ScheduledTaskManager:
                         if self._last_session_cleanup
                         else None
                     ),
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now_iso,
                 }
+                self._stats_cache = (time.monotonic(), stats)
+                return dict(stats)
             except Exception as e:
                 logger.error(f"Error getting session statistics: {e}")
                 return {
                     "auth_enabled": True,
                     "error": str(e),
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now_iso,
                 }
 
-    async def _run_periodic_demo_cleanup(self):
-        """Run demo mode database cleanup at the configured time daily."""
-        from app.core.auth_config import auth_settings
-
-        # Only run demo cleanup if demo mode is enabled
-        if not auth_settings.DEMO_MODE:
-            logger.debug("Demo mode not enabled, demo cleanup task will not run")
-            return
-
-        try:
-            while True:
-                try:
-                    # Calculate seconds until next cleanup time
-                    seconds_until_cleanup = self._calculate_seconds_until_demo_cleanup()
-
-                    logger.debug(
-                        f"Next demo cleanup in {seconds_until_cleanup} seconds"
-                    )
-
-                    # Wait until cleanup time
-                    await asyncio.sleep(seconds_until_cleanup)
-
-                    # Perform demo cleanup
-                    await self._perform_demo_cleanup()
-                    self._last_demo_cleanup = datetime.utcnow()
-
-                except Exception as e:
-                    logger.error(f"Error in demo cleanup task: {e}")
-                    # Wait 1 hour before retrying on error
-                    await asyncio.sleep(3600)
-
-        except asyncio.CancelledError:
-            logger.info("Demo cleanup task cancelled")
-            raise
-
-    def _calculate_seconds_until_demo_cleanup(self) -> int:
-        """Calculate seconds until the next demo cleanup time."""
-        from app.core.auth_config import auth_settings
-        from datetime import time, timedelta
-
-        # Parse cleanup time from settings
+    @cached_property
+    def _demo_cleanup_time(self) -> dt_time:
+        """Daily demo cleanup time parsed once from DEMO_CLEANUP_TIME."""
         try:
             hours, minutes = auth_settings.DEMO_CLEANUP_TIME.split(":")
-            cleanup_time = time(int(hours), int(minutes))
+            return dt_time(int(hours), int(minutes))
         except (ValueError, IndexError):
             logger.warning(
                 f"Invalid cleanup time format: {auth_settings.DEMO_CLEANUP_TIME}. Using 00:00"
             )
-            cleanup_time = time(0, 0)
+            return dt_time(0, 0)
 
-        now = datetime.utcnow()
-        cleanup_datetime = datetime.combine(now.date(), cleanup_time)
+    def _calculate_seconds_until_demo_cleanup(self) -> int:
+        """Calculate seconds until the next demo cleanup time."""
+        now = datetime.now(timezone.utc)
+        cleanup_datetime = datetime.combine(
+            now.date(), self._demo_cleanup_time, tzinfo=timezone.utc
+        )
 
         # If cleanup time has passed today, schedule for tomorrow
         if cleanup_datetime <= now:
@@ -351,115 +465,66 @@ class ScheduledTaskManager:
 
     async def _perform_demo_cleanup(self):
         """Perform demo mode database cleanup with error handling and recovery."""
-        from app.services.demo_service import demo_service
-        from app.core.auth_config import auth_settings
-
         # Only run demo cleanup if demo mode is enabled
         if not auth_settings.DEMO_MODE:
             return
 
         # Check if cleanup was already done today
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        if (
-            hasattr(self, "_last_demo_cleanup_date")
-            and self._last_demo_cleanup_date == today
-        ):
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        if self._last_demo_cleanup_date == today:
             logger.debug("Demo cleanup already performed today, skipping")
             return
 
-        max_retries = 3
-        retry_delay = 300  # 5 minutes
-
-        for attempt in range(max_retries):
-            try:
-                logger.info(
-                    f"Starting scheduled demo mode database cleanup (attempt {attempt + 1}/{max_retries})"
-                )
-
-                # Perform the cleanup using the demo service
-                success = await demo_service.cleanup_database()
-
-                if success:
-                    self._last_demo_cleanup_date = today
-                    logger.info(
-                        "Scheduled demo mode database cleanup completed successfully",
-                        extra={
-                            "event_type": "demo_cleanup_completed",
-                            "cleanup_date": today,
-                            "preserve_asset_id": auth_settings.DEMO_PRESERVE_ASSET_ID,
-                            "attempt": attempt + 1,
-                            "timestamp": datetime.utcnow().isoformat(),
-                        },
-                    )
-
-                    # Ensure demo asset exists after cleanup
-                    try:
-                        await demo_service.ensure_demo_asset_exists()
-                        logger.debug("Demo asset verification completed after cleanup")
-                    except Exception as asset_error:
-                        logger.warning(
-                            f"Failed to verify demo asset after cleanup: {asset_error}"
-                        )
-
-                    return  # Success, exit retry loop
-                else:
-                    logger.warning(
-                        f"Demo cleanup attempt {attempt + 1} failed, will retry if attempts remain"
-                    )
-
-                    # If this is not the last attempt, wait before retrying
-                    if attempt < max_retries - 1:
-                        logger.info(f"Waiting {retry_delay} seconds before retry...")
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-
-            except Exception as e:
-                logger.error(
-                    f"Error during scheduled demo cleanup attempt {attempt + 1}: {e}",
-                    extra={
-                        "event_type": "demo_cleanup_error",
-                        "cleanup_date": today,
-                        "attempt": attempt + 1,
-                        "error": str(e),
-                        "timestamp": datetime.utcnow().isoformat(),
-                    },
-                )
+        # Perform the cleanup using the demo service, which retries with backoff.
+        # The backoff sleeps inline; this job runs in its own scheduler task so
+        # the wait does not hold up other jobs.
+        success = await demo_service.cleanup_database_with_retry(
+            max_retries=DEMO_CLEANUP_MAX_RETRIES,
+            base_delay=DEMO_CLEANUP_RETRY_DELAY_SECONDS,
+        )
 
-                # If this is not the last attempt, wait before retrying
-                if attempt < max_retries - 1:
-                    logger.info(f"Waiting {retry_delay} seconds before retry...")
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
+        if not success:
+            logger.error(
+                f"Demo mode database cleanup failed after {DEMO_CLEANUP_MAX_RETRIES} attempts",
+                extra={
+                    "event_type": "demo_cleanup_failed_all_attempts",
+                    "cleanup_date": today,
+                    "max_retries": DEMO_CLEANUP_MAX_RETRIES,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                },
+            )
+            return
 
-        # All attempts failed
-        logger.error(
-            f"Demo mode database cleanup failed after {max_retries} attempts",
+        self._last_demo_cleanup_date = today
+        logger.info(
+            "Scheduled demo mode database cleanup completed successfully",
             extra={
-                "event_type": "demo_cleanup_failed_all_attempts",
+                "event_type": "demo_cleanup_completed",
                 "cleanup_date": today,
-                "max_retries": max_retries,
-                "timestamp": datetime.utcnow().isoformat(),
+                "preserve_asset_id": auth_settings.DEMO_PRESERVE_ASSET_ID,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
             },
         )
 
+        # Ensure demo asset exists after cleanup
+        try:
+            await demo_service.ensure_demo_asset_exists()
+            logger.debug("Demo asset verification completed after cleanup")
+        except Exception as asset_error:
+            logger.warning(f"Failed to verify demo asset after cleanup: {asset_error}")
+
     async def get_demo_cleanup_status(self) -> Dict[str, Any]:
         """Get demo mode cleanup status for monitoring purposes."""
-        from app.core.auth_config import auth_settings
-        from datetime import time, timedelta
-
         if not auth_settings.DEMO_MODE:
             return {"demo_mode": False}
 
-        try:
-            # Parse cleanup time
-            try:
-                hours, minutes = auth_settings.DEMO_CLEANUP_TIME.split(":")
-                cleanup_time = time(int(hours), int(minutes))
-            except (ValueError, IndexError):
-                cleanup_time = time(0, 0)
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
 
-            now = datetime.utcnow()
-            next_cleanup = datetime.combine(now.date(), cleanup_time)
+        try:
+            next_cleanup = datetime.combine(
+                now.date(), self._demo_cleanup_time, tzinfo=timezone.utc
+            )
             if next_cleanup <= now:
                 next_cleanup += timedelta(days=1)
 
@@ -472,11 +537,12 @@ class ScheduledTaskManager:
                     if self._last_demo_cleanup
                     else None
                 ),
-                "last_cleanup_date": getattr(self, "_last_demo_cleanup_date", None),
+                "last_cleanup_date": self._last_demo_cleanup_date,
                 "next_cleanup": next_cleanup.isoformat(),
-                "cleanup_task_running": self._demo_cleanup_task is not None
-                and not self._demo_cleanup_task.done(),
-                "timestamp": datetime.utcnow().isoformat(),
+                "cleanup_task_running": self._scheduler_task is not None
+                and not self._scheduler_task.done()
+                and "demo_cleanup" in self._jobs,
+                "timestamp": now_iso,
             }
 
         except Exception as e:
@@ -484,7 +550,7 @@ class ScheduledTaskManager:
             return {
                 "demo_mode": True,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso,
             }
 
     @property
@@ -6,9 +6,10 @@ with graceful degradation strategies.
 """
 
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, Callable, TypeVar, Awaitable
-from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, Optional, Callable, TypeVar, Awaitable, Tuple
+from datetime import datetime, timezone
 from functools import wraps
 
 # Set up logger
@@ -18,14 +19,38 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+class CircuitOpenError(Exception):
+    """Raised when a call is blocked because its circuit breaker is open."""
+
+
 class CircuitBreaker:
     """
     Circuit breaker pattern implementation for external API calls.
 
     This class implements the circuit breaker pattern to prevent
     repeated calls to failing external APIs.
+
+    Elapsed-time checks use ``time.monotonic()``. Wall-clock times are kept
+    as ``time.time_ns()`` integers and only turned into datetimes by
+    ``get_status()``. The closed-state check in
+    ``allow_request`` is a single attribute read, and state transitions are
+    serialized with a lock so concurrent workers don't race each other.
     """
 
+    __slots__ = (
+        "name",
+        "failure_threshold",
+        "reset_timeout",
+        "half_open_timeout",
+        "failures",
+        "state",
+        "last_failure_ns",
+        "last_success_ns",
+        "_last_failure_mono",
+        "_lock",
+        "_iso_memo",
+    )
+
     def __init__(
         self,
         name: str,
@@ -50,31 +75,51 @@ class CircuitBreaker:
         # Circuit state
         self.failures = 0
         self.state = "closed"  # closed, open, half-open
-        self.last_failure_time = None
-        self.last_success_time = None
+        self.last_failure_ns: Optional[int] = None
+        self.last_success_ns: Optional[int] = None
+        self._last_failure_mono = 0.0
+        self._lock = threading.Lock()
+
+        # ISO strings for get_status, keyed on the timestamp they were built from
+        self._iso_memo: Dict[str, Tuple[int, str]] = {}
 
     def record_success(self):
         """Record a successful API call."""
-        self.failures = 0
-        self.state = "closed"
-        self.last_success_time = datetime.now(timezone.utc)
+        if self.state != "closed" or self.failures:
+            with self._lock:
+                self.failures = 0
+                self.state = "closed"
+        self.last_success_ns = time.time_ns()
+
+    def record_failure(self, now: Optional[float] = None):
+        """
+        Record a failed API call.
+
+        Args:
+            now: Monotonic timestamp of the failure, taken if not provided
+        """
+        with self._lock:
+            self.failures += 1
+            self._last_failure_mono = now or time.monotonic()
+            self.last_failure_ns = time.time_ns()
 
-    def record_failure(self):
-        """Record a failed API call."""
-        self.failures += 1
-        self.last_failure_time = datetime.now(timezone.utc)
+            # Check if we should open the circuit
+            opened = self.failures >= self.failure_threshold
+            if opened:
+                self.state = "open"
 
-        # Check if we should open the circuit
-        if self.failures >= self.failure_threshold:
-            self.state = "open"
+        if opened:
             logger.warning(
                 f"Circuit breaker '{self.name}' opened after {self.failures} failures"
             )
 
-    def allow_request(self) -> bool:
+    def allow_request(self, now: Optional[float] = None) -> bool:
         """
         Check if a request should be allowed.
 
+        Args:
+            now: Current monotonic timestamp, taken if not provided
+
         Returns:
             True if the request should be allowed, False otherwise
         """
@@ -82,19 +127,17 @@ class CircuitBreaker:
         if self.state == "closed":
             return True
 
+        time_since_failure = (now or time.monotonic()) - self._last_failure_mono
+
         # If circuit is open, check if we should try a half-open state
         if self.state == "open":
             # Check if reset timeout has passed
-            if self.last_failure_time is None:
-                return True
-
-            time_since_failure = (
-                datetime.now(timezone.utc) - self.last_failure_time
-            ).total_seconds()
-
             if time_since_failure >= self.reset_timeout:
                 # Reset timeout has passed, try a half-open state
-                self.state = "half-open"
+                with self._lock:
+                    if self.state != "open":
+                        return True
+                    self.state = "half-open"
                 logger.info(
                     f"Circuit breaker '{self.name}' entering half-open state after {time_since_failure:.2f}s"
                 )
@@ -106,13 +149,6 @@ class CircuitBreaker:
         # If circuit is half-open, allow one request
         if self.state == "half-open":
             # Check if half-open timeout has passed since last attempt
-            if self.last_failure_time is None:
-                return True
-
-            time_since_failure = (
-                datetime.now(timezone.utc) - self.last_failure_time
-            ).total_seconds()
-
             if time_since_failure >= self.half_open_timeout:
                 # Half-open timeout has passed, allow one request
                 logger.info(
@@ -126,6 +162,27 @@ class CircuitBreaker:
         # Unknown state, allow the request
         return True
 
+    def _isoformat(self, key: str, value: Optional[int]) -> Optional[str]:
+        """
+        Format a timestamp, reusing the last result while it is unchanged.
+
+        Args:
+            key: Memo slot for the timestamp
+            value: Timestamp in nanoseconds since the epoch
+
+        Returns:
+            ISO 8601 string, or None if the timestamp is not set
+        """
+        if value is None:
+            return None
+
+        memo = self._iso_memo.get(key)
+        if memo is None or memo[0] != value:
+            timestamp = datetime.fromtimestamp(value / 1e9, tz=timezone.utc)
+            memo = self._iso_memo[key] = (value, timestamp.isoformat())
+
+        return memo[1]
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get the status of the circuit breaker.
@@ -138,11 +195,11 @@ class CircuitBreaker:
             "state": self.state,
             "failures": self.failures,
             "failure_threshold": self.failure_threshold,
-            "last_failure_time": (
-                self.last_failure_time.isoformat() if self.last_failure_time else None
+            "last_failure_time": self._isoformat(
+                "last_failure_time", self.last_failure_ns
             ),
-            "last_success_time": (
-                self.last_success_time.isoformat() if self.last_success_time else None
+            "last_success_time": self._isoformat(
+                "last_success_time", self.last_success_ns
             ),
         }
 
@@ -150,23 +207,51 @@ class CircuitBreaker:
 # Global registry of circuit breakers
 _circuit_breakers: Dict[str, CircuitBreaker] = {}
 
+# External APIs guarded by a circuit breaker, registered at import time
+EXTERNAL_API_BREAKERS = ("finnhub", "yahoo_finance", "coingecko")
 
-def get_circuit_breaker(name: str) -> CircuitBreaker:
+
+def register_circuit_breaker(name: str, **config: Any) -> CircuitBreaker:
     """
-    Get or create a circuit breaker.
+    Create and register a circuit breaker.
+
+    Registering an existing name returns the already registered breaker,
+    so its state is never reset.
 
     Args:
         name: Name of the circuit breaker
+        **config: Keyword arguments passed to CircuitBreaker
 
     Returns:
         CircuitBreaker instance
     """
-    if name not in _circuit_breakers:
-        _circuit_breakers[name] = CircuitBreaker(name)
+    circuit_breaker = _circuit_breakers.get(name)
+    if circuit_breaker is None:
+        circuit_breaker = _circuit_breakers[name] = CircuitBreaker(name, **config)
+
+    return circuit_breaker
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Get a registered circuit breaker.
+
+    Args:
+        name: Name of the circuit breaker
 
+    Returns:
+        CircuitBreaker instance
+
+    Raises:
+        KeyError: If no circuit breaker was registered under this name
+    """
     return _circuit_breakers[name]
 
 
+for _name in EXTERNAL_API_BREAKERS:
+    register_circuit_breaker(_name)
+
+
 def with_circuit_breaker(
     name: str,
     fallback_func: Optional[Callable[..., Awaitable[T]]] = None,
@@ -174,6 +259,9 @@ def with_circuit_breaker(
     """
     Decorator for applying circuit breaker pattern to async functions.
 
+    The circuit breaker must already be registered when the decorator is
+    applied.
+
     Args:
         name: Name of the circuit breaker
         fallback_func: Async function to call if circuit is open
@@ -182,14 +270,17 @@ def with_circuit_breaker(
         Decorated function with circuit breaker
     """
 
+    # Resolve the breaker and its bound methods once, at decoration time
+    circuit_breaker = get_circuit_breaker(name)
+    allow_request = circuit_breaker.allow_request
+    record_success = circuit_breaker.record_success
+    record_failure = circuit_breaker.record_failure
+
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Get or create circuit breaker
-            circuit_breaker = get_circuit_breaker(name)
-
             # Check if request should be allowed
-            if not circuit_breaker.allow_request():
+            if not allow_request(time.monotonic()):
                 logger.warning(f"Circuit breaker '{name}' is open, request blocked")
 
                 # If fallback function is provided, call it
@@ -197,22 +288,22 @@ def with_circuit_breaker(
                     return await fallback_func(*args, **kwargs)
 
                 # No fallback, raise exception
-                raise Exception(f"Circuit breaker '{name}' is open, request blocked")
+                raise CircuitOpenError(
+                    f"Circuit breaker '{name}' is open, request blocked"
+                )
 
             try:
                 # Call the original function
                 result = await func(*args, **kwargs)
+            except Exception:
+                # Record failure when it happened and re-raise the exception
+                record_failure()
+                raise
 
-                # Record success
-                circuit_breaker.record_success()
-
-                return result
-            except Exception as e:
-                # Record failure
-                circuit_breaker.record_failure()
+            # Record success
+            record_success()
 
-                # Re-raise the exception
-                raise
+            return result
 
         return wrapper
 
@@ -15,8 +15,8 @@ const config = {
 			assets: 'build',
 			// Fallback for SPA routing - serve index.html for all routes
 			fallback: 'index.html',
-			// Disable precompression as FastAPI will handle it
-			precompress: false,
+			// Emit .br and .gz siblings; FastAPI serves them to clients that accept them
+			precompress: true,
 			// Enable strict mode for better error detection
 			strict: true
 		}),